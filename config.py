@@ -21,6 +21,8 @@ JIRA_CUSTOM_FIELDS = {
 # Application behavior
 CACHE_DURATION = int(os.environ.get('JIRA_CACHE_DURATION', '3600'))  # Cache duration in seconds
 LOG_LEVEL = os.environ.get('JIRA_LOG_LEVEL', 'INFO')
+# Concurrent changelog requests during a sync; 1 (the default) fetches issues one at a time
+JIRA_MAX_WORKERS = int(os.environ.get('JIRA_MAX_WORKERS', '1'))
 
 # Paths
 DATA_DIR = os.environ.get('JIRA_DATA_DIR', os.path.join(os.path.dirname(__file__), 'data'))
@@ -124,6 +126,7 @@ if __name__ == "__main__":
     print(f"  JIRA_BASE_URL: {JIRA_BASE_URL}")
     print(f"  JIRA_USERNAME: {JIRA_USERNAME}")
     print(f"  LOG_LEVEL: {LOG_LEVEL}")
+    print(f"  JIRA_MAX_WORKERS: {JIRA_MAX_WORKERS}")
     print(f"  DATA_DIR: {DATA_DIR}")
     print("\nElasticsearch configuration:")
     print(f"  ELASTIC_URL: {ELASTIC_URL}")
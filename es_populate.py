@@ -11,6 +11,7 @@ import logging
 import time
 import warnings
 from datetime import datetime, timedelta
+from itertools import islice
 from typing import Dict, List, Optional, Tuple, Any
 
 import requests
@@ -427,23 +428,26 @@ class JiraElasticsearchPopulator:
         all_bulk_operations_succeeded = True
         success_count = 0
         
+        # Track the last successfully processed history date
+        last_successful_date = None
+        total_records = 0
+        history_records = None
+        
         try:
-            # Get issue history records from JIRA
-            result = self.jira_service.get_issue_history(start_date=start_date, end_date=end_date, max_issues=max_issues)
-            if result is None:
-                history_records = []
-            else:
-                history_records = result
-                
-            # If we get here, JIRA authentication was successful
-            jira_connected = True
-            
-            # Track the last successfully processed history date
-            last_successful_date = None
+            # Stream issue history records from JIRA; they arrive in update order, so each batch
+            # is inserted as soon as it is full instead of holding every record in memory
+            history_records = self.jira_service.iter_issue_history(start_date=start_date, end_date=end_date, max_issues=max_issues)
             
             # Process records in batches
-            for i in range(0, len(history_records), bulk_size):
-                batch = history_records[i:i+bulk_size]
+            while True:
+                batch = list(islice(history_records, bulk_size))
+                
+                # If we get here, JIRA authentication was successful
+                jira_connected = True
+                if not batch:
+                    break
+                total_records += len(batch)
+                
                 inserted_count = self.bulk_insert_issue_history(batch, force_override=force_override)
                 success_count += inserted_count
                 
@@ -467,11 +471,15 @@ class JiraElasticsearchPopulator:
                         except (ValueError, TypeError):
                             logger.debug(f"Could not parse updated date: {last_record.get('issue_data', {}).get('updated')}")
             
-            logger.info(f"Successfully inserted {success_count} out of {len(history_records)} records")
+            logger.info(f"Successfully inserted {success_count} out of {total_records} records")
             
         except Exception as e:
             logger.error(f"Error fetching data from JIRA: {e}")
             all_bulk_operations_succeeded = False
+        finally:
+            # Release the record stream if the loop stopped before exhausting it
+            if history_records is not None:
+                history_records.close()
         
         # Early exit if nothing was processed successfully
         if success_count == 0:
@@ -1,8 +1,47 @@
 import logging
+import operator
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from typing import Dict, Any, Optional, List
-from time_utils import to_iso8601, calculate_working_minutes_since_date
+from time_utils import to_iso8601, parse_date, calculate_working_minutes_since_date, now
 from jira_field_manager import JiraFieldManager
-from utils import normalize_status_name
+from utils import normalize_status_name, intern_str
+
+# Custom fields worth extracting, as (field_key, field_name) pairs with the key pre-normalized
+_RELEVANT_CUSTOM_FIELDS = tuple(
+    (field_name.lower().replace(' ', '_'), field_name)
+    for field_name in ('Epic Link', 'Epic Name', 'Story Points', 'Team', 'Sprint', 'Epic Color')
+)
+
+# Most custom fields are only relevant for stories or epics
+_RELEVANT_BY_TYPE = {
+    'story': _RELEVANT_CUSTOM_FIELDS,
+    'epic': _RELEVANT_CUSTOM_FIELDS,
+}
+
+# Standard JIRA fields read for every issue, fetched together in one attrgetter call
+_BASE_ISSUE_FIELDS = (
+    'summary', 'description', 'issuetype', 'status', 'priority', 'resolution',
+    'created', 'updated', 'resolutiondate', 'assignee', 'reporter', 'project',
+    'components', 'labels',
+)
+_get_base_issue_fields = operator.attrgetter(*_BASE_ISSUE_FIELDS)
+
+# Standard fields JIRA leaves out of 'fields' when they do not apply ('parent' on issues
+# that are not subtasks), read one by one so their absence keeps the attrgetter fast path
+_OPTIONAL_ISSUE_FIELDS = ('parent', 'timetracking')
+
+# Text of the first bracketed code without nested brackets, e.g. "DEV" in "Development [DEV]"
+_ALLOC_CODE_RE = re.compile(r'\[([^\[\]]*)\]')
+
+# Allocation codes accepted in the 'rodzaj_pracy' work type field
+_VALID_ALLOC = frozenset(('NEW', 'IMPR', 'PROD', 'KTLO'))
+
+
+def _missing_field(field_name, default=None):
+    """Field getter used when the source object is None."""
+    return default
 
 
 class IssueDataExtractor:
@@ -11,17 +50,98 @@ class IssueDataExtractor:
     This class follows the Single Responsibility Principle by focusing solely on data extraction.
     """
     
-    def __init__(self, field_manager: JiraFieldManager):
+    __slots__ = (
+        'field_manager', 'logger', 'emit_legacy',
+        '_sg', '_debug', '_warning',
+        '_field_set_cache', '_field_set_version',
+        '_custom_field_plan', '_custom_field_plan_version',
+        '_issue_type_lc',
+    )
+    
+    def __init__(self, field_manager: JiraFieldManager, emit_legacy: bool = True):
         """
         Initialize the extractor with a field manager.
         
         Args:
             field_manager: JiraFieldManager instance for handling field operations
+            emit_legacy: Whether to add the legacy backward-compatibility fields.
+                Analytics pipelines that only read the current field names should
+                pass False; only the legacy 'type' field is kept in that case.
         """
         self.field_manager = field_manager        
         self.logger = logging.getLogger(__name__)
+        self.emit_legacy = emit_legacy
+        # Bound once so per-field calls skip the method lookup on every issue
+        self._sg = field_manager.safe_get_field
+        self._debug = self.logger.debug
+        self._warning = self.logger.warning
+        self._field_set_cache = None
+        self._field_set_version = None
+        self._custom_field_plan = None
+        self._custom_field_plan_version = None
+        # Lower-cased issue type names keyed by the raw name (only a handful of types exist)
+        self._issue_type_lc = {}
+    
+    @property
+    def _cached_field_set(self) -> frozenset:
+        """Frozen set of the field manager's cached field names, rebuilt when field_ids changes."""
+        version = self.field_manager.field_ids_version
+        if self._field_set_cache is None or self._field_set_version != version:
+            self._field_set_cache = frozenset(self.field_manager.field_ids.keys())
+            self._field_set_version = version
+        return self._field_set_cache
     
-    def extract_issue_data(self, issue) -> Dict[str, Any]:
+    def _get_custom_field_plan(self) -> Dict[str, tuple]:
+        """Relevant custom field keys per issue type, limited to fields the field manager has cached."""
+        version = self.field_manager.field_ids_version
+        if self._custom_field_plan is None or self._custom_field_plan_version != version:
+            cached_fields = self._cached_field_set
+            self._custom_field_plan = {
+                issue_type: tuple(field_key for field_key, _ in relevant if field_key in cached_fields)
+                for issue_type, relevant in _RELEVANT_BY_TYPE.items()
+            }
+            self._custom_field_plan_version = version
+        return self._custom_field_plan
+    
+    def extract_issues_batch(self, issues) -> List[Dict[str, Any]]:
+        """
+        Extract data from a batch of JIRA issues.
+        
+        All issues in the batch share a single reference time for the working time
+        metrics, so the clock is read once per batch instead of once per issue.
+        
+        Args:
+            issues: Iterable of JIRA issue objects or dictionaries
+            
+        Returns:
+            List of dictionaries as returned by extract_issue_data, in input order
+        """
+        reference_time = now()
+        extract = self.extract_issue_data
+        return [extract(issue, reference_time) for issue in issues]
+    
+    def extract_issues_parallel(self, issues, max_workers: int = 8) -> List[Dict[str, Any]]:
+        """
+        Extract data from a batch of JIRA issues using a thread pool.
+        
+        Useful when field access may trigger lazy loading on the JIRA objects. Like
+        extract_issues_batch, all issues share a single reference time.
+        
+        Args:
+            issues: Iterable of JIRA issue objects or dictionaries
+            max_workers: Maximum number of worker threads
+            
+        Returns:
+            List of dictionaries as returned by extract_issue_data, in input order
+        """
+        reference_time = now()
+        # Warm the shared caches once so the workers only read them
+        self._get_custom_field_plan()
+        extract = self.extract_issue_data
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda issue: extract(issue, reference_time), issues))
+    
+    def extract_issue_data(self, issue, reference_time=None) -> Dict[str, Any]:
         """
         Extract comprehensive data from a JIRA issue.
         
@@ -30,6 +150,7 @@ class IssueDataExtractor:
         
         Args:
             issue: JIRA issue object or dictionary
+            reference_time: Optional datetime used as "now" for working time metrics
             
         Returns:
             Dictionary containing extracted issue data with the following structure:
@@ -133,39 +254,47 @@ class IssueDataExtractor:
             in the original issue object.
         """
         # Get fields and basic identifiers 
-        fields, issue_key, issue_id = self._extract_issue_fields(issue)
+        # Decide once whether this is a JIRA object; the helpers below branch on it
+        has_fields = hasattr(issue, 'fields')
+        fields, issue_key, issue_id = self._extract_issue_fields(issue, has_fields)
+        
+        # Pick the field accessor once per issue instead of dispatching on every field access
+        get_field = self._fields_accessor_for(fields)
         
         # Create result dictionary with base data
-        issue_data = self._extract_base_fields(fields, issue_key, issue_id)
+        issue_data = self._extract_base_fields(get_field, issue_key, issue_id)
           # Extract each type of data through dedicated methods
-        self._extract_type_and_status_fields(fields, issue_data)
-        self._extract_date_fields(fields, issue_data)
-        self._extract_people_fields(fields, issue_data)
-        self._extract_project_info(fields, issue_data)
-        self._extract_components(fields, issue_data)
-        self._extract_labels(fields, issue_data)
-        self._extract_parent_issue(fields, issue_data)
-        self._extract_custom_fields(issue, fields, issue_data)
-        self._extract_time_tracking(fields, issue_data)
-        self._extract_working_time_metrics(fields, issue_data)
+        self._extract_type_and_status_fields(get_field, issue_data)
+        created = self._extract_date_fields(get_field, issue_data)
+        self._extract_people_fields(get_field, issue_data)
+        self._extract_project_info(get_field, issue_data)
+        self._extract_components(get_field, issue_data)
+        self._extract_labels(get_field, issue_data)
+        self._extract_parent_issue(get_field, issue_data)
+        self._extract_custom_fields(issue, has_fields, issue_data)
+        self._extract_time_tracking(get_field, issue_data)
+        self._extract_working_time_metrics(created, issue_data, reference_time)
         
         # Extract allocation code (not a legacy field)
-        allocation_code = self._extract_allocation_code(issue)
+        allocation_code = self._extract_allocation_code(issue, has_fields)
         if allocation_code:
             issue_data['allocation_code'] = allocation_code
         
         # Add legacy fields for backward compatibility
-        self._add_legacy_fields(issue_data, issue)
+        if self.emit_legacy:
+            self._add_legacy_fields(issue_data, issue, has_fields)
+        else:
+            self._add_minimum_legacy_fields(issue_data)
         
         return issue_data
     
-    def _extract_issue_fields(self, issue) -> tuple:
+    def _extract_issue_fields(self, issue, has_fields: bool) -> tuple:
         """Extract fields object and basic identifiers based on issue type."""
-        if hasattr(issue, 'fields'):
+        if has_fields:
             # JIRA issue object - could be normal JIRA object or PropertyHolder
             fields = issue.fields
-            issue_key = self.safe_get_field(issue, 'key')
-            issue_id = self.safe_get_field(issue, 'id')
+            issue_key = self._sg(issue, 'key')
+            issue_id = self._sg(issue, 'id')
         elif isinstance(issue, dict):
             # Dictionary format
             fields = issue.get('fields', {})
@@ -173,141 +302,202 @@ class IssueDataExtractor:
             issue_id = issue.get('id')
         else:
             # Unknown object type, try best effort extraction
-            fields = self.safe_get_field(issue, 'fields', {})
-            issue_key = self.safe_get_field(issue, 'key', str(issue))
-            issue_id = self.safe_get_field(issue, 'id')
+            fields = self._sg(issue, 'fields', {})
+            issue_key = self._sg(issue, 'key', str(issue))
+            issue_id = self._sg(issue, 'id')
         
         return fields, issue_key, issue_id
     
-    def _extract_base_fields(self, fields, issue_key, issue_id) -> Dict[str, Any]:
-        """Extract the basic issue information."""
+    @staticmethod
+    def _accessor_for(obj):
+        """
+        Return a getter for fields of obj, chosen once for the object.
+        
+        The getter behaves like safe_get_field(obj, name, default) but avoids
+        re-checking the object type on every field access.
+        
+        Args:
+            obj: JIRA object, PropertyHolder, dictionary or None
+            
+        Returns:
+            Callable taking (field_name, default=None)
+        """
+        if obj is None:
+            return _missing_field
+        if isinstance(obj, dict):
+            return obj.get
+        return lambda field_name, default=None: getattr(obj, field_name, default)
+    
+    @classmethod
+    def _fields_accessor_for(cls, fields):
+        """
+        Return a getter for the issue fields object.
+        
+        For JIRA objects the standard fields are read with a single attrgetter call
+        and served from a dictionary, together with whichever optional fields are set.
+        Objects missing any of the standard fields fall back to the per-attribute
+        getter from _accessor_for.
+        
+        Args:
+            fields: JIRA fields object, dictionary or None
+            
+        Returns:
+            Callable taking (field_name, default=None)
+        """
+        if fields is not None and not isinstance(fields, dict):
+            try:
+                values = dict(zip(_BASE_ISSUE_FIELDS, _get_base_issue_fields(fields)))
+            except AttributeError:
+                pass
+            else:
+                for field_name in _OPTIONAL_ISSUE_FIELDS:
+                    value = getattr(fields, field_name, None)
+                    if value is not None:
+                        values[field_name] = value
+                return values.get
+        return cls._accessor_for(fields)
+    
+    def _extract_base_fields(self, get_field, issue_key, issue_id) -> Dict[str, Any]:
+        """
+        Extract the basic issue information.
+        
+        The keys filled in later for every issue are created here as well, so the
+        result dictionary is allocated at its final size instead of growing as the
+        other extraction steps add them.
+        """
         return {
             'key': issue_key,
             'id': issue_id,
-            'summary': self.safe_get_field(fields, 'summary'),
-            'description': self.safe_get_field(fields, 'description'),
+            'summary': get_field('summary'),
+            'description': get_field('description'),
+            # Always set by the date, people, components, labels and parent steps
+            'created': None,
+            'updated': None,
+            'resolved': None,
+            'assignee': None,
+            'reporter': None,
+            'components': None,
+            'labels': None,
+            'parent_issue': None,
         }
     
-    def _extract_type_and_status_fields(self, fields, issue_data) -> None:
-        """Extract issue type, status, priority and resolution fields."""
+    def _extract_type_and_status_fields(self, get_field, issue_data) -> None:
+        """Extract issue type, status, priority and resolution fields.
+        
+        The names repeat across every issue of a batch, so they are interned
+        to share one string object per distinct value.
+        """
         # Handle issue type
-        issuetype = self.safe_get_field(fields, 'issuetype')
+        issuetype = get_field('issuetype')
         if issuetype:
-            issue_data['issue_type'] = self.safe_get_field(issuetype, 'name')
+            issue_data['issue_type'] = intern_str(self._sg(issuetype, 'name'))
         
         # Handle status
-        status = self.safe_get_field(fields, 'status')
+        status = get_field('status')
         if status:
-            issue_data['status'] = normalize_status_name(self.safe_get_field(status, 'name'))
+            issue_data['status'] = intern_str(normalize_status_name(self._sg(status, 'name')))
         
         # Handle priority
-        priority = self.safe_get_field(fields, 'priority')
+        priority = get_field('priority')
         if priority:
-            issue_data['priority'] = self.safe_get_field(priority, 'name')
+            issue_data['priority'] = intern_str(self._sg(priority, 'name'))
         
         # Handle resolution
-        resolution = self.safe_get_field(fields, 'resolution')
+        resolution = get_field('resolution')
         if resolution:
-            issue_data['resolution'] = self.safe_get_field(resolution, 'name')
+            issue_data['resolution'] = intern_str(self._sg(resolution, 'name'))
     
-    def _extract_date_fields(self, fields, issue_data) -> None:
-        """Extract and format date fields."""
-        created = self.safe_get_field(fields, 'created')
-        updated = self.safe_get_field(fields, 'updated')
-        resolved = self.safe_get_field(fields, 'resolutiondate')
-        
-        issue_data.update({
-            'created': to_iso8601(created),
-            'updated': to_iso8601(updated),
-            'resolved': to_iso8601(resolved),
-        })
+    def _extract_date_fields(self, get_field, issue_data) -> Optional[datetime]:
+        """
+        Extract and format date fields.
+        
+        Returns:
+            The parsed creation date, so the working time metrics do not parse it again
+        """
+        created = parse_date(get_field('created'))
+        
+        issue_data['created'] = to_iso8601(created)
+        issue_data['updated'] = to_iso8601(get_field('updated'))
+        issue_data['resolved'] = to_iso8601(get_field('resolutiondate'))
+        return created
     
-    def _extract_people_fields(self, fields, issue_data) -> None:
+    def _extract_people_fields(self, get_field, issue_data) -> None:
         """Extract assignee and reporter information."""
-        # Extract assignee
-        assignee = self.safe_get_field(fields, 'assignee')
-        if assignee:
-            issue_data['assignee'] = self._extract_user_info(assignee)
-        else:
-            issue_data['assignee'] = None
-        
-        # Extract reporter
-        reporter = self.safe_get_field(fields, 'reporter')
-        if reporter:
-            issue_data['reporter'] = self._extract_user_info(reporter)
-        else:
-            issue_data['reporter'] = None
+        extract_user_info = self._extract_user_info
+        for role in ('assignee', 'reporter'):
+            user_obj = get_field(role)
+            issue_data[role] = extract_user_info(user_obj) if user_obj else None
     
     def _extract_user_info(self, user_obj) -> Dict[str, str]:
         """Extract standard user information from a user object."""
+        get_user_field = self._accessor_for(user_obj)
         return {
-            'display_name': self.safe_get_field(user_obj, 'displayName'),
-            'key': self.safe_get_field(user_obj, 'key'),
-            'name': self.safe_get_field(user_obj, 'name'),
-            'email_address': self.safe_get_field(user_obj, 'emailAddress')
+            'display_name': intern_str(get_user_field('displayName')),
+            'key': intern_str(get_user_field('key')),
+            'name': intern_str(get_user_field('name')),
+            'email_address': get_user_field('emailAddress')
         }
     
-    def _extract_project_info(self, fields, issue_data) -> None:
+    def _extract_project_info(self, get_field, issue_data) -> None:
         """Extract project information."""
-        project = self.safe_get_field(fields, 'project')
+        project = get_field('project')
         if project:
+            get_project_field = self._accessor_for(project)
             issue_data['project'] = {
-                'key': self.safe_get_field(project, 'key'),
-                'name': self.safe_get_field(project, 'name'),
-                'id': self.safe_get_field(project, 'id')
+                'key': intern_str(get_project_field('key')),
+                'name': intern_str(get_project_field('name')),
+                'id': get_project_field('id')
             }
     
-    def _extract_components(self, fields, issue_data) -> None:
-        """Extract components information."""
-        components = self.safe_get_field(fields, 'components') or []
-        issue_data['components'] = []
-        
-        if components:
-            for comp in components:
-                try:
-                    comp_data = {
-                        'id': self.safe_get_field(comp, 'id'),
-                        'name': self.safe_get_field(comp, 'name'),
-                        'description': self.safe_get_field(comp, 'description')
-                    }
-                    issue_data['components'].append(comp_data)
-                except Exception as e:
-                    self.logger.debug(f"Error processing component {comp}: {e}")
+    def _extract_components(self, get_field, issue_data) -> None:
+        """Extract components information together with the legacy component names list."""
+        # Identity check instead of truthiness, which can be costly on JIRA resources
+        components = get_field('components', ())
+        if components is None:
+            components = ()
+        try:
+            comp_list = [
+                {'id': comp.get('id'), 'name': comp.get('name'), 'description': comp.get('description')}
+                if isinstance(comp, dict) else
+                {'id': getattr(comp, 'id', None), 'name': getattr(comp, 'name', None),
+                 'description': getattr(comp, 'description', None)}
+                for comp in components
+            ]
+        except Exception as e:
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self._debug("Error processing components %s: %s", components, e)
+            comp_list = []
+        issue_data['components'] = comp_list
+        
+        if comp_list and self.emit_legacy:
+            issue_data['component_names'] = [comp['name'] for comp in comp_list if comp['name']]
     
-    def _extract_labels(self, fields, issue_data) -> None:
+    def _extract_labels(self, get_field, issue_data) -> None:
         """Extract and normalize labels."""
+        labels = get_field('labels')
         try:
-            labels = self.safe_get_field(fields, 'labels') or []
-            
-            # Normalize labels to always be a list
-            if labels:
-                if not isinstance(labels, list):
-                    try:
-                        issue_data['labels'] = list(labels) if hasattr(labels, '__iter__') else [str(labels)]
-                    except Exception as e:
-                        self.logger.debug(f"Error converting labels to list: {e}")
-                        issue_data['labels'] = [str(labels)]
-                else:
-                    issue_data['labels'] = labels
-            else:
-                issue_data['labels'] = []
+            # Jira returns a list of strings (or None) in practically every case
+            issue_data['labels'] = labels if labels.__class__ is list else ([] if labels is None else list(labels))
         except Exception as e:
-            self.logger.debug(f"Error processing labels: {e}")
-            issue_data['labels'] = []
+            # Safety net for non-iterable values
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self._debug("Error processing labels: %s", e)
+            issue_data['labels'] = [str(labels)] if labels else []
     
-    def _extract_parent_issue(self, fields, issue_data) -> None:
+    def _extract_parent_issue(self, get_field, issue_data) -> None:
         """Extract parent issue information if available."""
-        parent = self.safe_get_field(fields, 'parent')
+        parent = get_field('parent')
         issue_data['parent_issue'] = None
         
         if parent:
-            parent_id = self.safe_get_field(parent, 'id')
-            parent_key = self.safe_get_field(parent, 'key')
-            parent_fields = self.safe_get_field(parent, 'fields')
+            get_parent_field = self._accessor_for(parent)
+            parent_id = get_parent_field('id')
+            parent_key = get_parent_field('key')
+            parent_fields = get_parent_field('fields')
             
             parent_summary = None
             if parent_fields:
-                parent_summary = self.safe_get_field(parent_fields, 'summary')
+                parent_summary = self._sg(parent_fields, 'summary')
             
             issue_data['parent_issue'] = {
                 'id': parent_id,
@@ -317,101 +507,115 @@ class IssueDataExtractor:
             
             # Log if we have a parent but couldn't get all required information
             if not parent_key and not parent_id:
-                self.logger.debug(f"Parent found but couldn't extract key or ID from: {parent}")
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self._debug("Parent found but couldn't extract key or ID from: %s", parent)
     
-    def _extract_custom_fields(self, issue, fields, issue_data) -> None:
+    def _extract_custom_fields(self, issue, has_fields: bool, issue_data) -> None:
         """Extract custom fields based on issue type."""
-        try:
-            # Only extract custom fields based on issue type
-            issue_type_name = issue_data.get('issue_type', '').lower()
-            relevant_fields = []
-            
-            # Most fields are only relevant for stories or epics
-            if issue_type_name in ['story', 'epic']:
-               relevant_fields.extend(['Epic Link', 'Epic Name', 'Story Points', 'Team', 'Sprint', 'Epic Color'])
-            
-            # Get cached fields to avoid unnecessary warnings
-            cached_fields = self.field_manager.field_ids.keys()
-            
-            # Extract only cached relevant fields
-            for field_name in relevant_fields:
-                field_key = field_name.lower().replace(' ', '_')
-                if field_key in cached_fields:
-                    field_value = self.field_manager.get_field_value(
-                        issue if hasattr(issue, 'fields') else None, 
-                        field_key
-                    )
-                    if field_value is not None:
-                        issue_data[field_key] = field_value
-        except Exception as e:
-            self.logger.debug(f"Error extracting custom fields: {e}")
+        # The field manager only reads custom fields from JIRA objects
+        if not has_fields:
+            return
+        
+        # Only extract custom fields based on issue type
+        raw_issue_type = issue_data.get('issue_type') or ''
+        issue_type_name = self._issue_type_lc.get(raw_issue_type)
+        if issue_type_name is None:
+            issue_type_name = self._issue_type_lc[raw_issue_type] = raw_issue_type.lower()
+        get_field_value = self.field_manager.get_field_value
+        
+        # Extract only cached relevant fields (the plan skips uncached ones to avoid warnings)
+        for field_key in self._get_custom_field_plan().get(issue_type_name, ()):
+            try:
+                field_value = get_field_value(issue, field_key)
+            except (AttributeError, KeyError) as e:
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self._debug("Error extracting custom field %s: %s", field_key, e)
+                continue
+            if field_value is not None:
+                issue_data[field_key] = field_value
     
-    def _extract_time_tracking(self, fields, issue_data) -> None:
+    def _extract_time_tracking(self, get_field, issue_data) -> None:
         """Extract time tracking information."""
-        time_tracking = self.safe_get_field(fields, 'timetracking')
+        time_tracking = get_field('timetracking')
         if time_tracking:
+            get_tracking_field = self._accessor_for(time_tracking)
             issue_data['time_tracking'] = {
-                'original_estimate': self.safe_get_field(time_tracking, 'originalEstimate'),
-                'remaining_estimate': self.safe_get_field(time_tracking, 'remainingEstimate'),
-                'time_spent': self.safe_get_field(time_tracking, 'timeSpent'),
-                'original_estimate_seconds': self.safe_get_field(time_tracking, 'originalEstimateSeconds'),
-                'remaining_estimate_seconds': self.safe_get_field(time_tracking, 'remainingEstimateSeconds'),
-                'time_spent_seconds': self.safe_get_field(time_tracking, 'timeSpentSeconds')
+                'original_estimate': get_tracking_field('originalEstimate'),
+                'remaining_estimate': get_tracking_field('remainingEstimate'),
+                'time_spent': get_tracking_field('timeSpent'),
+                'original_estimate_seconds': get_tracking_field('originalEstimateSeconds'),
+                'remaining_estimate_seconds': get_tracking_field('remainingEstimateSeconds'),
+                'time_spent_seconds': get_tracking_field('timeSpentSeconds')
             }
     
-    def _extract_working_time_metrics(self, fields, issue_data) -> None:
-        """Calculate and extract working time metrics."""
-        created = self.safe_get_field(fields, 'created')
+    def _extract_working_time_metrics(self, created, issue_data, reference_time=None) -> None:
+        """Calculate and extract working time metrics from the parsed creation date."""
         if created:
-            working_minutes = calculate_working_minutes_since_date(created)
+            working_minutes = calculate_working_minutes_since_date(created, reference_time)
             if working_minutes is not None:
                 issue_data['working_minutes_since_created'] = working_minutes
     
-    def _add_legacy_fields(self, issue_data: Dict[str, Any], issue) -> None:
+    def _add_minimum_legacy_fields(self, issue_data: Dict[str, Any]) -> None:
+        """
+        Add only the legacy 'type' field, which the Elasticsearch document formatter reads.
+        
+        Args:
+            issue_data: The extracted issue data dictionary
+        """
+        if 'issue_type' in issue_data:
+            issue_data['type'] = issue_data['issue_type']
+    
+    def _add_legacy_fields(self, issue_data: Dict[str, Any], issue, has_fields: bool) -> None:
         """
         Add legacy fields to maintain backward compatibility.
         
         Args:
             issue_data: The extracted issue data dictionary
             issue: The original JIRA issue object
+            has_fields: Whether issue is a JIRA object with a 'fields' attribute
         """
         # Map new field names to legacy field names
-        if 'issue_type' in issue_data:
-            issue_data['type'] = issue_data['issue_type']
+        self._add_minimum_legacy_fields(issue_data)
         
         # Add simple string format for assignee/reporter (original format compatibility)
-        if 'assignee' in issue_data and issue_data['assignee']:
-            issue_data['assignee_display_name'] = issue_data['assignee'].get('display_name')
+        # (user dicts always come from _extract_user_info, so 'display_name' is present)
+        assignee = issue_data.get('assignee')
+        if assignee:
+            issue_data['assignee_display_name'] = assignee['display_name']
         
-        if 'reporter' in issue_data and issue_data['reporter']:
-            issue_data['reporter_display_name'] = issue_data['reporter'].get('display_name')
+        reporter = issue_data.get('reporter')
+        if reporter:
+            issue_data['reporter_display_name'] = reporter['display_name']
           
-        # Add simple component names list (original format compatibility)
-        if 'components' in issue_data and issue_data['components']:
-            try:
-                issue_data['component_names'] = [comp.get('name') for comp in issue_data['components'] if isinstance(comp, dict) and comp.get('name')]
-            except Exception as e:
-                self.logger.debug(f"Error creating component_names: {e}")
-                issue_data['component_names'] = []
+        # Simple component names list is built by _extract_components in the same pass
         
         # Add working minutes field with legacy name
-        if 'working_minutes_since_created' in issue_data:
-            issue_data['minutes_since_creation'] = issue_data['working_minutes_since_created']
+        working_minutes = issue_data.get('working_minutes_since_created')
+        if working_minutes is not None:
+            issue_data['minutes_since_creation'] = working_minutes
           # Extract status change date if available (legacy field)
+        if has_fields:
+            # Skip the field manager round-trip when the field is not defined on this instance
+            status_change_date = None
+            if 'data_zmiany_statusu' in self._cached_field_set:
+                status_change_date = self._extract_status_change_date(issue)
+            issue_data['status_change_date'] = status_change_date
+    
+    def _extract_status_change_date(self, issue) -> Optional[str]:
+        """Read the 'data zmiany statusu' custom field as an ISO 8601 string."""
         try:
-            if hasattr(issue, 'fields'):
-                status_change_date = None
-                data_zmiany_statusu_value = self.field_manager.get_field_value(issue, 'data_zmiany_statusu')
-                if data_zmiany_statusu_value:
-                    try:
-                        status_change_date = to_iso8601(data_zmiany_statusu_value)
-                    except (ValueError, TypeError):
-                        self.logger.debug(f"Could not parse 'data zmiany statusu' date: {data_zmiany_statusu_value}")
-                
-                issue_data['status_change_date'] = status_change_date
-                
+            value = self.field_manager.get_field_value(issue, 'data_zmiany_statusu')
         except Exception as e:
-            self.logger.debug(f"Error adding legacy fields: {e}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self._debug("Error reading 'data zmiany statusu': %s", e)
+            return None
+        
+        if isinstance(value, datetime) and value.tzinfo is not None:
+            return value.isoformat()
+        if value:
+            # to_iso8601 logs and returns None for values it cannot parse
+            return to_iso8601(value)
+        return None
     
     def _extract_allocation_info(self, rodzaj_pracy_value=None) -> tuple:
         """Extract allocation value and code from the rodzaj_pracy (work type) field.
@@ -432,21 +636,24 @@ class IssueDataExtractor:
         
         # Extract the string value from the field
         if rodzaj_pracy_value is not None:
-            # Check if rodzaj_pracy is a CustomFieldOption object
-            if hasattr(rodzaj_pracy_value, 'value'):
-                allocation_value = rodzaj_pracy_value.value
-            elif isinstance(rodzaj_pracy_value, str):
+            if isinstance(rodzaj_pracy_value, str):
                 allocation_value = rodzaj_pracy_value
+            else:
+                # CustomFieldOption objects carry the option text in 'value'
+                allocation_value = getattr(rodzaj_pracy_value, 'value', None)
           # Extract the code from brackets if the format is "Something [CODE]"
-        if allocation_value and '[' in allocation_value and ']' in allocation_value:
+        if allocation_value and ']' in allocation_value:
             try:
-                allocation_code = allocation_value.split('[')[1].split(']')[0]
-            except (IndexError, AttributeError):
-                self.logger.debug(f"Could not extract allocation code from value: {allocation_value}")
+                match = _ALLOC_CODE_RE.search(allocation_value)
+                if match:
+                    allocation_code = match.group(1)
+            except (TypeError, AttributeError):
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self._debug("Could not extract allocation code from value: %s", allocation_value)
         
         return allocation_value, allocation_code
         
-    def _extract_allocation_code(self, issue) -> str:
+    def _extract_allocation_code(self, issue, has_fields: bool) -> str:
         """
         Extract and validate the allocation code from the issue.
         
@@ -454,11 +661,16 @@ class IssueDataExtractor:
         
         Args:
             issue: The JIRA issue object
+            has_fields: Whether issue is a JIRA object with a 'fields' attribute
             
         Returns:
             str: The extracted and validated allocation code, or None if not found or invalid
         """
-        if not hasattr(issue, 'fields'):
+        if not has_fields:
+            return None
+        
+        # Most projects never define the work type field
+        if 'rodzaj_pracy' not in self._cached_field_set:
             return None
             
         # Get rodzaj_pracy value using field manager for allocation information
@@ -467,11 +679,11 @@ class IssueDataExtractor:
             # Extract allocation info
             allocation_value, allocation_code = self._extract_allocation_info(rodzaj_pracy_value)
 
-            valid_codes = ['NEW', 'IMPR', 'PROD', 'KTLO']
-            if allocation_code in valid_codes:
+            if allocation_code in _VALID_ALLOC:
                 return allocation_code
-            else:
-                self.logger.warning(f"Invalid allocation code: {allocation_code}. Must be one of {valid_codes}")
+            # Only a present-but-unknown code is worth a warning
+            if allocation_code is not None:
+                self._warning("Invalid allocation code: %s. Must be one of %s", allocation_code, sorted(_VALID_ALLOC))
         return None
 
     def epic_enricher(self, issue_data: Dict[str, Any], delegate_get_issue) -> None:
@@ -490,19 +702,21 @@ class IssueDataExtractor:
         try:
             # First check if this issue already has epic information
             if self._has_epic_info(issue_data):
-                self.logger.debug(f"Issue {issue_data.get('key')} already has epic information")
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self._debug("Issue %s already has epic information", issue_data.get('key'))
                 return
             
             # Check if current issue is an epic itself (has epic_name)
             if self._extract_epic_from_current_issue(issue_data):
-                self.logger.debug(f"Issue {issue_data.get('key')} is an epic itself")
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self._debug("Issue %s is an epic itself", issue_data.get('key'))
                 return
             
             # If no epic found, check parent hierarchy
             self._check_parent_for_epic(issue_data, delegate_get_issue, max_depth=5)
             
         except Exception as e:
-            self.logger.error(f"Error in epic_enricher for issue {issue_data.get('key', 'unknown')}: {str(e)}")
+            self.logger.error("Error in epic_enricher for issue %s: %s", issue_data.get('key', 'unknown'), e)
     
     def _has_epic_info(self, issue_data: Dict[str, Any]) -> bool:
         """Check if issue already has epic information."""
@@ -525,7 +739,8 @@ class IssueDataExtractor:
                 'name': epic_name or issue_data.get('summary'),
                 'summary': issue_data.get('summary')
             }
-            self.logger.debug(f"Issue {issue_data.get('key')} is an epic with name: {epic_name}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self._debug("Issue %s is an epic with name: %s", issue_data.get('key'), epic_name)
             return True
         return False
     
@@ -542,22 +757,24 @@ class IssueDataExtractor:
             bool: True if epic information was found and set, False otherwise
         """
         if max_depth <= 0:
-            self.logger.warning(f"Max depth reached while searching for epic in parent hierarchy for {issue_data.get('key')}")
+            self._warning("Max depth reached while searching for epic in parent hierarchy for %s", issue_data.get('key'))
             return False
         
         parent_issue = issue_data.get('parent_issue')
         if not parent_issue or not parent_issue.get('key'):
-            self.logger.debug(f"No parent issue found for {issue_data.get('key')}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self._debug("No parent issue found for %s", issue_data.get('key'))
             return False
         
         parent_key = parent_issue.get('key')
-        self.logger.debug(f"Checking parent issue {parent_key} for epic information")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self._debug("Checking parent issue %s for epic information", parent_key)
         
         try:
             # Get parent issue data using the delegate
             parent_data = delegate_get_issue(parent_key)
             if not parent_data:
-                self.logger.warning(f"Could not retrieve parent issue data for {parent_key}")
+                self._warning("Could not retrieve parent issue data for %s", parent_key)
                 return False
             
             # Check if parent has epic information we can inherit
@@ -568,14 +785,15 @@ class IssueDataExtractor:
             if self._extract_epic_from_current_issue(parent_data):
                 # Copy the epic info from parent to current issue
                 issue_data['epic_issue'] = parent_data.get('epic_issue')
-                self.logger.debug(f"Inherited epic from parent epic {parent_key}")
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self._debug("Inherited epic from parent epic %s", parent_key)
                 return True
             
             # Recursively check parent's parent
             return self._check_parent_for_epic(parent_data, delegate_get_issue, max_depth - 1)
             
         except Exception as e:
-            self.logger.error(f"Error checking parent {parent_key} for epic info: {str(e)}")
+            self.logger.error("Error checking parent %s for epic info: %s", parent_key, e)
             return False
     
     def _copy_epic_from_parent(self, issue_data: Dict[str, Any], parent_data: Dict[str, Any]) -> bool:
@@ -593,7 +811,8 @@ class IssueDataExtractor:
                 'name': parent_epic.get('name'),
                 'summary': parent_epic.get('summary')
             }
-            self.logger.debug(f"Copied epic {parent_epic.get('key')} from parent {parent_data.get('key')}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self._debug("Copied epic %s from parent %s", parent_epic.get('key'), parent_data.get('key'))
             return True
         return False
 
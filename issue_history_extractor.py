@@ -6,14 +6,23 @@ It follows the Single Responsibility Principle by focusing solely on history dat
 """
 
 import logging
-from typing import Dict, Any, Optional, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Tuple, NamedTuple
 from time_utils import (
     to_iso8601, parse_date, 
     calculate_working_minutes_between, format_working_minutes_to_text
 )
-from utils import normalize_status_name
+from utils import normalize_status_name, intern_str
 from jira_field_manager import JiraFieldManager
 
+# Standard JIRA fields read to build a comprehensive issue record; requested explicitly so JIRA
+# does not send every field of the issue. A field added to the record must be added here too.
+ISSUE_RECORD_FIELDS = (
+    'summary', 'description', 'issuetype', 'status', 'priority', 'resolution',
+    'created', 'updated', 'resolutiondate', 'assignee', 'reporter', 'project',
+    'components', 'labels', 'parent', 'timetracking', 'comment',
+)
+
 # Shared workflow order dictionary for consistent status ordering across methods
 WORKFLOW_ORDER = {
     # Backlog/planning phase
@@ -47,8 +56,104 @@ WORKFLOW_ORDER = {
     'canceled': 18
 }
 
+# Order of statuses missing from WORKFLOW_ORDER when analyzing a single transition's direction
+UNKNOWN_STATUS_ORDER = 999
+
+# Status categories for the categorized time metrics; statuses not listed count as waiting
+CATEGORY_BACKLOG, CATEGORY_PROCESSING, CATEGORY_WAITING, CATEGORY_COMPLETED = range(4)
+
+STATUS_CATEGORIES = {
+    'backlog': CATEGORY_BACKLOG,
+    'in progress': CATEGORY_PROCESSING,
+    'in review': CATEGORY_PROCESSING,
+    'testing': CATEGORY_PROCESSING,
+    'completed': CATEGORY_COMPLETED,
+    'done': CATEGORY_COMPLETED,
+    'closed': CATEGORY_COMPLETED,
+    'resolved': CATEGORY_COMPLETED
+}
+
+# (category, workflow order) per raw status name, filled in by _status_info
+_status_info_cache = {}
+
+# Lower-cased, stripped comparison key per raw status name, filled in by _status_lookup_key
+_status_key_cache = {}
+
+# Interned normalized status name per raw changelog status name, filled in by _normalized_status
+_normalized_status_cache = {}
+
 logger = logging.getLogger(__name__)
 
+
+class StatusEvent(NamedTuple):
+    """A status change from the changelog; a plain tuple, so it carries no per-record dict."""
+    history_date: Any
+    from_status: Optional[str]
+    to_status: Optional[str]
+    author: Optional[str]
+
+
+def _status_lookup_key(status_name: Optional[str]) -> str:
+    """
+    Get the lower-cased, stripped form of a status name used for comparisons.
+    
+    Only a handful of distinct status names exist, so results are memoized per raw name.
+    
+    Args:
+        status_name: Status name as it appears in the status change history
+        
+    Returns:
+        The comparison key; empty for a missing status
+    """
+    try:
+        return _status_key_cache[status_name]
+    except KeyError:
+        key = status_name.lower().strip() if status_name else ''
+        _status_key_cache[status_name] = key
+        return key
+
+
+def _status_info(status_name: Optional[str]) -> Tuple[int, int]:
+    """
+    Get the category and workflow order of a status in a case-insensitive way.
+    
+    Only a handful of distinct status names exist, so results are memoized per raw name.
+    
+    Args:
+        status_name: Status name as it appears in the status change history
+        
+    Returns:
+        Tuple of (category, workflow order); unknown statuses are waiting with order 0
+    """
+    info = _status_info_cache.get(status_name)
+    if info is None:
+        key = _status_lookup_key(status_name)
+        info = (STATUS_CATEGORIES.get(key, CATEGORY_WAITING), WORKFLOW_ORDER.get(key, 0))
+        _status_info_cache[status_name] = info
+    return info
+
+
+def _normalized_status(status_name: Optional[str]) -> Optional[str]:
+    """
+    Normalize and intern a status name from the changelog.
+    
+    normalize_status_name builds its mapping on every call, while only a handful of
+    distinct raw names exist, so results are memoized per raw name.
+    
+    Args:
+        status_name: Status name as it appears in a changelog item
+        
+    Returns:
+        The interned normalized status name
+    """
+    try:
+        return _normalized_status_cache[status_name]
+    except KeyError:
+        normalized = intern_str(normalize_status_name(status_name))
+        _normalized_status_cache[status_name] = normalized
+        return normalized
+
+
 class IssueHistoryExtractor:
     """
     Handles extraction of issue history data from JIRA issues.
@@ -173,18 +278,24 @@ class IssueHistoryExtractor:
             status_transitions = []
             field_changes = []
             
-            if hasattr(issue, 'changelog') and hasattr(issue.changelog, 'histories'):
-                # Process status change history for calculations
-                status_change_history = self._extract_status_change_history(issue)
-                
-                # Calculate status-related metrics
-                status_metrics = self._calculate_status_metrics(issue_data, status_change_history)
+            histories = getattr(getattr(issue, 'changelog', None), 'histories', None)
+            if histories is not None:
+                # Walk the changelog once, splitting status changes from other field changes
+                status_events, field_changes = self._extract_changelog_changes(histories)
                 
-                # Extract status transitions with detailed information
-                status_transitions = self._extract_detailed_status_transitions(issue)
+                # Walk the status events once; the minutes spent in each status are
+                # shared by the metrics and the detailed transitions
+                all_status_metrics = self._compute_all_status_metrics(
+                    status_events, parse_date(issue_data.get('created')), parse_date(issue_data.get('updated')),
+                    self._status_key(issue_data['status']), build_transitions=False
+                )
+                status_metrics = self._calculate_status_metrics(issue_data, status_events, all_status_metrics)
                 
-                # Extract non-status field changes
-                field_changes = self._extract_field_changes(issue)
+                # Build status transitions with detailed information
+                status_transitions = self._build_detailed_status_transitions(
+                    status_events, getattr(issue.fields, 'created', None),
+                    all_status_metrics['minutes_in_previous_statuses']
+                )
             else:
                 # No changelog available, create minimal metrics
                 status_metrics = {
@@ -226,76 +337,162 @@ class IssueHistoryExtractor:
             self.logger.error(f"Error extracting comprehensive issue data for {issue_key}: {str(e)}")
             raise
     
+    def requested_fields(self) -> List[str]:
+        """
+        Get the JIRA fields to request for issues passed to extract_issue_changelog.
+        
+        Returns:
+            ISSUE_RECORD_FIELDS plus the IDs of the custom fields cached by the field manager
+        """
+        custom_field_ids = [field_id for field_id in self.field_manager.field_ids.values() if field_id]
+        return list(ISSUE_RECORD_FIELDS) + custom_field_ids
+    
+    def extract_issue_changelogs_parallel(self, issues, max_workers: int = 4) -> List[Dict[str, Any]]:
+        """
+        Extract comprehensive issue records for a batch of JIRA issues using a thread pool.
+        
+        Lets a caller overlap extraction with fetching the next page of issues from JIRA.
+        
+        Args:
+            issues: Iterable of JIRA issue objects (expanded with changelog and comments)
+            max_workers: Maximum number of worker threads
+            
+        Returns:
+            List of records as returned by extract_issue_changelog, in input order
+        """
+        extract = self.extract_issue_changelog
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda issue: extract(issue, getattr(issue, 'key', None)), issues))
+    
     def _extract_description(self, issue, issue_key: str) -> Optional[str]:
         """Extract description content from the issue."""
-        description_text = None
+        description_text = getattr(issue.fields, 'description', None)
         
-        if hasattr(issue.fields, 'description') and issue.fields.description:
+        if description_text and self.logger.isEnabledFor(logging.DEBUG):
             try:
-                description_text = issue.fields.description
                 # If description is very large, truncate it in logs to avoid log bloat
                 log_desc = description_text[:1000] + "..." if len(description_text) > 1000 else description_text
-                self.logger.debug(f"Found description for issue {issue_key}: {log_desc}")
+                self.logger.debug("Found description for issue %s: %s", issue_key, log_desc)
             except Exception as e:
                 self.logger.warning(f"Error processing description for {issue_key}: {e}")        
-        return description_text
+        return description_text or None
 
     def _extract_comments(self, issue, issue_key: str) -> Optional[list]:
         """Extract all comments from the issue as an array of comment objects."""
         comments_array = None
+        comments = getattr(getattr(issue.fields, 'comment', None), 'comments', None)
         
-        if hasattr(issue.fields, 'comment') and hasattr(issue.fields.comment, 'comments'):
+        if comments:
             try:
-                # Extract comments as an array of objects
-                comments_array = []
-                for comment in issue.fields.comment.comments:
-                    if hasattr(comment, 'body') and comment.body:
-                        created_at = to_iso8601(comment.created) if hasattr(comment, 'created') else None
-                        author = comment.author.displayName if hasattr(comment, 'author') and hasattr(comment.author, 'displayName') else None
-                        
-                        comment_obj = {
-                            'created_at': created_at,
-                            'body': comment.body,
-                            'author': author
-                        }
-                        comments_array.append(comment_obj)
+                # Extract comments as an array of objects, skipping comments without a body
+                comments_array = [
+                    {
+                        'created_at': to_iso8601(getattr(comment, 'created', None)),
+                        'body': comment.body,
+                        'author': getattr(getattr(comment, 'author', None), 'displayName', None)
+                    }
+                    for comment in comments if getattr(comment, 'body', None)
+                ]
                         
                 if comments_array:
-                    self.logger.debug(f"Found {len(comments_array)} comments for issue {issue_key}")
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug("Found %d comments for issue %s", len(comments_array), issue_key)
                 else:
                     comments_array = None  # Return None if no comments found
             except Exception as e:
                 self.logger.warning(f"Error processing comments for {issue_key}: {e}")                
         return comments_array
   
-    def _extract_status_change_history(self, issue) -> List[Dict[str, Any]]:
-        """Extract all status changes from the changelog for analysis."""
-        status_change_history = []
+    def _extract_changelog_changes(self, histories) -> Tuple[List[StatusEvent], List[Dict[str, Any]]]:
+        """
+        Split the changelog into status changes and other field changes in a single pass.
         
-        if hasattr(issue, 'changelog') and hasattr(issue.changelog, 'histories'):
-            histories = list(issue.changelog.histories)
+        Args:
+            histories: JIRA changelog histories; any iterable, walked once without copying
             
-            for history in histories:
-                history_date = parse_date(history.created)
-                status_changes = []
-                  # Only include status field changes
-                for item in history.items:
-                    if item.field == 'status':                        status_changes.append({
-                            'field': item.field,
-                            'from': normalize_status_name(item.fromString),
-                            'to': normalize_status_name(item.toString)
-                        })
-                
-                # Only add history entry if it contains status changes
-                if status_changes:
-                    status_change_history.append({
-                        'historyDate': history_date,                    
-                        'changes': status_changes
-                    })
-        
-        # Sort status change history chronologically (oldest first)
-        status_change_history.sort(key=lambda x: x['historyDate'])
-        return status_change_history
+        Returns:
+            Tuple of (status_events, field_changes):
+            - status_events: one StatusEvent per history containing a status change,
+              with normalized status names, sorted chronologically
+            - field_changes: non-status field changes grouped by history, sorted by change date
+        """
+        status_events = []
+        field_changes = []
+        previous_date = None
+        in_order = True
+        get_author = self._get_history_author
+        
+        for history in histories:
+            history_date = parse_date(history.created)
+            if in_order and previous_date is not None and history_date < previous_date:
+                in_order = False
+            previous_date = history_date
+            items = history.items
+            # A history entry changes the status at most once; keep the first item
+            status_item = next((item for item in items if item.field == 'status'), None)
+            non_status_changes = [
+                {
+                    'field': intern_str(item.field),
+                    'fieldtype': intern_str(getattr(item, 'fieldtype', 'jira')),
+                    'from': item.fromString,
+                    'to': item.toString
+                }
+                for item in items if item.field != 'status'
+            ]
+            
+            if status_item is None and not non_status_changes:
+                continue
+            author = get_author(history)
+            
+            if status_item is not None:
+                status_events.append(StatusEvent(
+                    history_date,
+                    _normalized_status(status_item.fromString),
+                    _normalized_status(status_item.toString),
+                    author
+                ))
+            
+            if non_status_changes:
+                field_changes.append({
+                    'change_date': to_iso8601(history_date),
+                    'author': author,
+                    'changes': non_status_changes
+                })
+        
+        # JIRA returns histories oldest first; only out-of-order input needs sorting
+        if not in_order:
+            status_events.sort(key=lambda event: event[0])
+            field_changes.sort(key=lambda x: parse_date(x['change_date']))
+        return status_events, field_changes
+    
+    @staticmethod
+    def _status_events_from_history(status_change_history: List[Dict[str, Any]]) -> List[StatusEvent]:
+        """
+        Flatten a status change history into (history_date, from_status, to_status, author) events.
+        
+        Only the first status change of each history entry is used; entries without a
+        status change are skipped.
+        
+        Args:
+            status_change_history: List of {'historyDate': ..., 'changes': [...]} entries
+            
+        Returns:
+            List of status events in the order of the history
+        """
+        status_events = []
+        for history in status_change_history:
+            for change in history['changes']:
+                if change['field'] == 'status':
+                    status_events.append(StatusEvent(history['historyDate'], change['from'], change['to'], history.get('author')))
+                    break
+        return status_events
+    
+    def _get_history_author(self, history) -> Optional[str]:
+        """Get the display name (or user name) of the author of a changelog history."""
+        author = getattr(history, 'author', None)
+        if author is None:
+            return None
+        return intern_str(getattr(author, 'displayName', None) or getattr(author, 'name', None))
     
     def _calculate_categorized_time_metrics(self, status_change_history: List[Dict[str, Any]], 
                                            creation_date: Any, update_date: Any) -> Dict[str, Any]:
@@ -319,80 +516,14 @@ class IssueHistoryExtractor:
                 'processing_minutes': int, 
                 'waiting_minutes': int
             }
-        """        # Define status categories (case-insensitive)
-        processing_statuses = {'in progress', 'in review', 'testing'}
-        backlog_statuses = {'backlog'}
-        completed_statuses = {'completed', 'done', 'closed', 'resolved'}
-        
-        # Initialize counters
-        backlog_minutes = 0
-        processing_minutes = 0
-        waiting_minutes = 0
-        
-        # Track current status and when it started
-        current_status = None
-        status_start_date = creation_date
-        
-        # If there are no status changes, we need to determine the initial status
-        # and calculate time based on that
-        if not status_change_history:
-            # Default initial status is usually 'Backlog' or similar - categorize as backlog
-            total_minutes = calculate_working_minutes_between(creation_date, update_date)
-            waiting_minutes = total_minutes
-            return {
-                'backlog_minutes': backlog_minutes,
-                'processing_minutes': processing_minutes,
-                'waiting_minutes': waiting_minutes
-            }
-          # Find the initial status from the first status change
-        initial_status = None
-        for history in status_change_history:
-            for change in history['changes']:
-                if change['field'] == 'status':
-                    initial_status = change['from']
-                    break
-            if initial_status:
-                break
-        
-        # If we couldn't find initial status, assume 'Backlog'
-        if not initial_status:
-            initial_status = 'Backlog'
-        
-        current_status = initial_status
-        
-        # Process each status change
-        for history in status_change_history:
-            for change in history['changes']:
-                if change['field'] == 'status':
-                    # Calculate time spent in previous status
-                    time_in_status = calculate_working_minutes_between(status_start_date, history['historyDate'])                    # Categorize the time based on the status we're leaving
-                    if self._is_in_category(current_status, backlog_statuses):
-                        backlog_minutes += time_in_status
-                    elif self._is_in_category(current_status, processing_statuses):
-                        processing_minutes += time_in_status
-                    elif not self._is_in_category(current_status, completed_statuses):
-                        # Not in backlog, processing, or completed = waiting
-                        waiting_minutes += time_in_status
-                    # If in completed status, we don't count the time
-                    
-                    # Update for next iteration
-                    current_status = change['to']
-                    status_start_date = history['historyDate']
-                    break        # Calculate time spent in final status (from last change to update date)
-        if not self._is_in_category(current_status, completed_statuses):
-            time_in_final_status = calculate_working_minutes_between(status_start_date, update_date)
-            
-            if self._is_in_category(current_status, backlog_statuses):
-                backlog_minutes += time_in_final_status
-            elif self._is_in_category(current_status, processing_statuses):
-                processing_minutes += time_in_final_status
-            else:
-                waiting_minutes += time_in_final_status
-        
+        """
+        metrics = self._compute_all_status_metrics(
+            self._status_events_from_history(status_change_history), creation_date, update_date
+        )
         return {
-            'backlog_minutes': backlog_minutes,
-            'processing_minutes': processing_minutes,
-            'waiting_minutes': waiting_minutes
+            'backlog_minutes': metrics['backlog_minutes'],
+            'processing_minutes': metrics['processing_minutes'],
+            'waiting_minutes': metrics['waiting_minutes']
         }
 
     def _calculate_status_transition_metrics(self, status_change_history: List[Dict[str, Any]], 
@@ -428,23 +559,10 @@ class IssueHistoryExtractor:
                 'unique_statuses_visited': ['Open', 'In progress', 'In review']
             }
         """
-        # Initialize result structure        
-        transitions = []
-        unique_statuses = set()
-        backflow_count = 0
+        status_events = self._status_events_from_history(status_change_history)
         
-        def get_workflow_order(status_name):
-            """Get workflow order for a status name in a case-insensitive way."""
-            if not status_name:
-                return 0
-            return WORKFLOW_ORDER.get(status_name.lower().strip(), 0)
-        
-        # Track current status and timing
-        current_status = None
-        previous_status = None
-        status_start_date = creation_date
-          # If no status changes, return minimal data
-        if not status_change_history:
+        # If no status changes, return minimal data
+        if not status_events:
             return {
                 'status_transitions': [],
                 'current_status': 'Backlog',  # Default initial status
@@ -453,157 +571,243 @@ class IssueHistoryExtractor:
                 'backflow_count': 0,
                 'unique_statuses_visited': ['Backlog']
             }
-          # Find initial status from first change
-        initial_status = 'Backlog'  # Default
-        for history in status_change_history:
-            for change in history['changes']:
-                if change['field'] == 'status':
-                    initial_status = change['from']
-                    break
-            if initial_status:  # Break when we find any initial status
-                break
         
+        metrics = self._compute_all_status_metrics(status_events, creation_date, update_date)
+        return {
+            'status_transitions': metrics['status_transitions'],
+            'current_status': metrics['current_status'],
+            'previous_status': metrics['previous_status'],
+            'total_transitions': metrics['total_transitions'],
+            'backflow_count': metrics['backflow_count'],
+            'unique_statuses_visited': metrics['unique_statuses_visited'],
+            'current_status_minutes': metrics['current_status_minutes']
+        }
+
+    def _compute_all_status_metrics(self, status_events: List[StatusEvent],
+                                    creation_date: Any, update_date: Any,
+                                    current_status_name: Optional[str] = None,
+                                    build_transitions: bool = True) -> Dict[str, Any]:
+        """
+        Compute all status-based metrics in a single pass over the status change events.
+        
+        The working minutes spent in each status are calculated once and shared by the
+        categorized time metrics and the transition records.
+        
+        Args:
+            status_events: Chronological (history_date, from_status, to_status, author) events
+            creation_date: Issue creation date
+            update_date: Issue last update date
+            current_status_name: Lower-cased current status of the issue; when given, the
+                date of the most recent change to that status is tracked as well
+            build_transitions: Whether to build the 'status_transitions' records; callers that
+                only need the metrics can skip them and leave the list empty
+            
+        Returns:
+            Dictionary combining the results of _calculate_categorized_time_metrics and
+            _calculate_status_transition_metrics, plus:
+            {
+                'last_change_to_current': datetime or None,  # Most recent change to current_status_name
+                'todo_exit_date': datetime or None,           # Date of the first status change
+                'current_status_start': datetime or None,     # Start of the final status, when
+                                                              # current_status_minutes was calculated
+                'minutes_in_previous_statuses': [int, ...]    # Minutes before each event
+            }
+        """
+        # If there are no status changes, all time since creation counts as waiting
+        if not status_events:
+            return {
+                'backlog_minutes': 0,
+                'processing_minutes': 0,
+                'waiting_minutes': calculate_working_minutes_between(creation_date, update_date),
+                'status_transitions': [],
+                'current_status': 'Backlog',
+                'previous_status': None,
+                'total_transitions': 0,
+                'backflow_count': 0,
+                'unique_statuses_visited': ['Backlog'],
+                'current_status_minutes': 0,
+                'last_change_to_current': None,
+                'todo_exit_date': None,
+                'current_status_start': None,
+                'minutes_in_previous_statuses': []
+            }
+        
+        # The first status change normally answers both: its 'from' is the initial status and
+        # its date is when the issue left it. Otherwise the first non-empty 'from' is used.
+        first_date, initial_status = status_events[0][:2]
+        todo_exit_date = first_date if initial_status else None
+        if not initial_status:
+            initial_status = next((from_status for _, from_status, _, _ in status_events if from_status),
+                                  status_events[-1][1])
+        
+        # Working minutes per category, indexed by the CATEGORY_* codes
+        category_minutes = [0, 0, 0, 0]
+        minutes_in_previous_statuses = []
+        transitions = []
+        # Keyed by status in visiting order, so the visited list comes out in a stable order
+        unique_statuses = {initial_status: None}
+        backflow_count = 0
+        
+        # Track current status and when it started; an unknown initial status is categorized as backlog
         current_status = initial_status
-        unique_statuses.add(initial_status)
+        category = _status_info(initial_status or 'Backlog')[0]
+        current_order = _status_info(current_status)[1]
+        previous_status = None
+        status_start_date = creation_date
+        last_change_to_current = None
+        
+        # Bound once so the per-event calls skip the global and attribute lookups
+        working_minutes_between = calculate_working_minutes_between
+        status_info = _status_info
+        status_key = _status_lookup_key
+        record_minutes = minutes_in_previous_statuses.append
+        
+        for history_date, _, to_status, _ in status_events:
+            # Calculate time spent in previous status (shared by both metric types)
+            minutes_in_previous = working_minutes_between(status_start_date, history_date)
+            record_minutes(minutes_in_previous)
+            
+            # Categorize the time based on the status we're leaving (completed time is not counted)
+            if category != CATEGORY_COMPLETED:
+                category_minutes[category] += minutes_in_previous
+            
+            # Determine if this is a backflow (moving to "earlier" status)
+            to_category, to_order = status_info(to_status)
+            is_backflow = current_order > to_order > 0
+            is_forward = 0 < current_order < to_order
+            
+            if is_backflow:
+                backflow_count += 1
+            
+            if build_transitions:
+                transitions.append({
+                    'from_status': current_status,
+                    'to_status': to_status,
+                    'transition_date': to_iso8601(history_date),
+                    'minutes_in_previous_status': minutes_in_previous,
+                    'is_forward_transition': is_forward,
+                    'is_backflow': is_backflow
+                })
+            
+            # Update tracking variables
+            previous_status = current_status
+            current_status = to_status
+            category, current_order = to_category, to_order
+            unique_statuses[current_status] = None
+            status_start_date = history_date
+            
+            # Remember the most recent change to the issue's current status
+            if (current_status_name is not None and to_status is not None and
+                    status_key(to_status) == current_status_name):
+                last_change_to_current = history_date
         
-        # Process each status change
-        for history in status_change_history:
-            for change in history['changes']:
-                if change['field'] == 'status':
-                    # Calculate time spent in previous status
-                    minutes_in_previous = calculate_working_minutes_between(
-                        status_start_date, history['historyDate']
-                    )
-                      # Determine if this is a backflow (moving to "earlier" status)
-                    from_order = get_workflow_order(current_status)
-                    to_order = get_workflow_order(change['to'])
-                    is_backflow = from_order > to_order and from_order > 0 and to_order > 0
-                    is_forward = from_order < to_order and from_order > 0 and to_order > 0
-                    
-                    if is_backflow:
-                        backflow_count += 1
-                    
-                    # Record transition
-                    transition = {
-                        'from_status': current_status,
-                        'to_status': change['to'],
-                        'transition_date': to_iso8601(history['historyDate']),
-                        'minutes_in_previous_status': minutes_in_previous,
-                        'is_forward_transition': is_forward,
-                        'is_backflow': is_backflow
-                    }
-                    transitions.append(transition)
-                    
-                    # Update tracking variables
-                    previous_status = current_status
-                    current_status = change['to']
-                    unique_statuses.add(current_status)
-                    status_start_date = history['historyDate']
-                    break        # Calculate time in current status (if not completed)
-        completed_statuses_check = {'completed', 'done', 'closed', 'resolved'}
+        # Calculate time spent in final status (from last change to update date), if not completed
         current_status_minutes = 0
-        if not self._is_in_category(current_status, completed_statuses_check):
+        current_status_start = None
+        if category != CATEGORY_COMPLETED:
             current_status_minutes = calculate_working_minutes_between(status_start_date, update_date)
+            category_minutes[category] += current_status_minutes
+            current_status_start = status_start_date
         
         return {
+            'backlog_minutes': category_minutes[CATEGORY_BACKLOG],
+            'processing_minutes': category_minutes[CATEGORY_PROCESSING],
+            'waiting_minutes': category_minutes[CATEGORY_WAITING],
             'status_transitions': transitions,
             'current_status': current_status,
             'previous_status': previous_status,
-            'total_transitions': len(transitions),
+            'total_transitions': len(status_events),
             'backflow_count': backflow_count,
-            'unique_statuses_visited': list(unique_statuses),            'current_status_minutes': current_status_minutes
+            'unique_statuses_visited': list(unique_statuses),
+            'current_status_minutes': current_status_minutes,
+            'last_change_to_current': last_change_to_current,
+            'todo_exit_date': todo_exit_date,
+            'current_status_start': current_status_start,
+            'minutes_in_previous_statuses': minutes_in_previous_statuses
         }
 
+    @staticmethod
+    def _status_key(status_name: Optional[str]) -> str:
+        """Get the lower-cased, stripped form of a status name used for comparisons."""
+        return _status_lookup_key(status_name)
+
     def _calculate_status_metrics(self, issue_data: Dict[str, Any], 
-                                status_change_history: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Calculate status-related metrics for the issue."""
-        creation_date = issue_data.get('created')
-        update_date = issue_data.get('updated')
+                                status_events: List[StatusEvent],
+                                metrics: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Calculate status-related metrics for the issue.
         
-        # Calculate total working minutes from creation
+        Args:
+            issue_data: Basic issue data with 'status', 'created' and 'updated'
+            status_events: Chronological status change events
+            metrics: Result of _compute_all_status_metrics for these events, if already computed
+            
+        Returns:
+            Dictionary with the issue's status metrics
+        """
+        created = issue_data.get('created')
+        # Parse the issue dates once; every working minutes calculation below reuses them
+        creation_date = parse_date(created)
+        update_date = parse_date(issue_data.get('updated'))
+        
+        # Walk the status events once for categorized, transition and status change metrics
+        if metrics is None:
+            metrics = self._compute_all_status_metrics(
+                status_events, creation_date, update_date, self._status_key(issue_data['status']),
+                build_transitions=False
+            )
+        
+        # Calculate total working minutes from creation; an issue that never changed status
+        # has all of that time counted as waiting already
         working_minutes_from_create = 0
         if creation_date and update_date:
-            working_minutes_from_create = calculate_working_minutes_between(creation_date, update_date)
-          # Find current status change date and calculate minutes in current status
-        status_name = issue_data['status']
-        status_name_lower = status_name.lower().strip() if status_name else ''
-        status_change_date = None
-        working_minutes_in_current_status = 0
-          # Find the most recent status change to the current status
-        for history in reversed(status_change_history):
-            for change in history['changes']:
-                if (change['field'] == 'status' and 
-                    change['to'].lower().strip() == status_name_lower):
-                    status_change_date = history['historyDate']
-                    break
-            if status_change_date:
-                break
+            if status_events:
+                working_minutes_from_create = calculate_working_minutes_between(creation_date, update_date)
+            else:
+                working_minutes_from_create = metrics['waiting_minutes']
+        
+        # The issue is usually still in the status set by its last change (always so with a
+        # single change), whose minutes up to the update date are already known
+        current_status_start = metrics['current_status_start']
         
-        # Calculate working minutes in current status
+        # Calculate working minutes in current status from the most recent change to it
+        status_change_date = metrics['last_change_to_current']
         if status_change_date:
-            working_minutes_in_current_status = calculate_working_minutes_between(status_change_date, update_date)
+            if status_change_date == current_status_start:
+                working_minutes_in_current_status = metrics['current_status_minutes']
+            else:
+                working_minutes_in_current_status = calculate_working_minutes_between(status_change_date, update_date)
+            status_change_iso = to_iso8601(status_change_date)
         else:
             # If no status change found, time in status equals total time from creation
             working_minutes_in_current_status = working_minutes_from_create
-            status_change_date = creation_date  # Use creation date as fallback
+            # Use creation date as fallback; the data extractor already provides it as ISO 8601
+            status_change_iso = created if isinstance(created, str) else to_iso8601(created)
         
         # Calculate working minutes from first move (todo exit date)
-        todo_exit_date = self._find_todo_exit_date(status_change_history)
+        todo_exit_date = metrics['todo_exit_date']
         working_minutes_from_first_move = 0
         if todo_exit_date and update_date:
-            working_minutes_from_first_move = calculate_working_minutes_between(todo_exit_date, update_date)
-        
-        # Calculate categorized time metrics
-        categorized_metrics = self._calculate_categorized_time_metrics(status_change_history, creation_date, update_date)
-        
-        # Calculate status transition metrics
-        transition_metrics = self._calculate_status_transition_metrics(status_change_history, creation_date, update_date)
+            if todo_exit_date == current_status_start:
+                working_minutes_from_first_move = metrics['current_status_minutes']
+            else:
+                working_minutes_from_first_move = calculate_working_minutes_between(todo_exit_date, update_date)
         
         return {
             'working_minutes_from_create': working_minutes_from_create,
             'working_minutes_in_current_status': working_minutes_in_current_status,
             'working_minutes_from_first_move': working_minutes_from_first_move,
-            'backlog_minutes': categorized_metrics['backlog_minutes'],
-            'processing_minutes': categorized_metrics['processing_minutes'],
-            'waiting_minutes': categorized_metrics['waiting_minutes'],
-            'previous_status': transition_metrics['previous_status'],
-            'total_transitions': transition_metrics['total_transitions'],
-            'backflow_count': transition_metrics['backflow_count'],
-            'unique_statuses_visited': transition_metrics['unique_statuses_visited'],
+            'backlog_minutes': metrics['backlog_minutes'],
+            'processing_minutes': metrics['processing_minutes'],
+            'waiting_minutes': metrics['waiting_minutes'],
+            'previous_status': metrics['previous_status'],
+            'total_transitions': metrics['total_transitions'],
+            'backflow_count': metrics['backflow_count'],
+            'unique_statuses_visited': metrics['unique_statuses_visited'],
             'todo_exit_date': to_iso8601(todo_exit_date) if todo_exit_date else None,
-            'status_change_date': to_iso8601(status_change_date) if status_change_date else None,
+            'status_change_date': status_change_iso or None,
         }
     
-    def _find_todo_exit_date(self, status_change_history: List[Dict[str, Any]]) -> Optional[Any]:
-        """Find the date when the issue first changed status from its initial status."""
-        todo_exit_date = None
-        initial_status_found = False
-        
-        # First, determine what the initial status was
-        initial_status = 'Backlog'  # Default assumption
-        
-        # If we have any status changes, check the first one to find the actual initial status
-        for history_item in status_change_history:
-            for change in history_item['changes']:
-                if change['field'] == 'status':
-                    initial_status = change['from']
-                    initial_status_found = True
-                    break
-            if initial_status_found:
-                break        # Now find the first status change from this initial status
-        for history_item in status_change_history:
-            for change in history_item['changes']:
-                if (change['field'] == 'status' and 
-                    change['from'] and initial_status and 
-                    change['from'].lower().strip() == initial_status.lower().strip()):
-                    todo_exit_date = history_item['historyDate']
-                    self.logger.debug(f"First status change from '{initial_status}' on {todo_exit_date}")
-                    break
-            if todo_exit_date:
-                break
-        
-        return todo_exit_date
-    
     
     def _extract_detailed_status_transitions(self, issue) -> List[Dict[str, Any]]:
         """
@@ -615,115 +819,74 @@ class IssueHistoryExtractor:
         Returns:
             List of status transition records with detailed information
         """
-        transitions = []
-        
-        if not (hasattr(issue, 'changelog') and hasattr(issue.changelog, 'histories')):
-            return transitions
-        
-        # Get status change history for timing calculations
-        status_change_history = self._extract_status_change_history(issue)
-        
-        # Track timing for each transition
-        previous_status_start = issue.fields.created if hasattr(issue.fields, 'created') else None
-        
-        for i, history in enumerate(status_change_history):
-            for change in history['changes']:
-                if change['field'] == 'status':
-                    # Calculate time spent in previous status
-                    minutes_in_previous = 0
-                    if previous_status_start:
-                        minutes_in_previous = calculate_working_minutes_between(
-                            previous_status_start, history['historyDate']
-                        )
-                    
-                    # Find the original history record for author information
-                    author_name = None
-                    author_display = None
-                    for orig_history in issue.changelog.histories:
-                        if parse_date(orig_history.created) == history['historyDate']:
-                            if hasattr(orig_history, 'author'):
-                                author_name = orig_history.author.name if hasattr(orig_history.author, 'name') else None
-                                author_display = orig_history.author.displayName if hasattr(orig_history.author, 'displayName') else None
-                            break
-                    
-                    # Determine if this is a forward or backward transition
-                    is_forward, is_backflow = self._analyze_transition_direction(
-                        change['from'], change['to']
-                    )
-                      # Calculate days and time period string for minutes_in_previous_status
-                    # Using 8-hour working days (60 * 8 = 480 minutes per day)
-                    days_in_previous = int(minutes_in_previous / 480) if minutes_in_previous else 0
-                    period_text = format_working_minutes_to_text(minutes_in_previous)
-                    
-                    transition_record = {
-                        'from_status': change['from'],
-                        'to_status': change['to'],
-                        'transition_date': to_iso8601(history['historyDate']),
-                        'minutes_in_previous_status': minutes_in_previous,
-                        'days_in_previous_status': days_in_previous,
-                        'period_in_previous_status': period_text,
-                        'is_forward_transition': is_forward,
-                        'is_backflow': is_backflow,
-                        'author': author_display or author_name
-                    }
-                    
-                    transitions.append(transition_record)
-                    
-                    # Update for next iteration
-                    previous_status_start = history['historyDate']
-                    break
-        
-        return transitions
+        histories = getattr(getattr(issue, 'changelog', None), 'histories', None)
+        if histories is None:
+            return []
+        
+        status_events, _ = self._extract_changelog_changes(histories)
+        return self._build_detailed_status_transitions(
+            status_events, getattr(issue.fields, 'created', None)
+        )
     
-    def _extract_field_changes(self, issue) -> List[Dict[str, Any]]:
+    def _build_detailed_status_transitions(self, status_events: List[StatusEvent],
+                                           creation_date: Any,
+                                           minutes_in_previous_statuses: Optional[List[int]] = None) -> List[Dict[str, Any]]:
         """
-        Extract all non-status field changes from the changelog.
+        Build detailed status transition records from the extracted status change events.
         
         Args:
-            issue: JIRA issue object with changelog
+            status_events: Status change events from _extract_changelog_changes
+            creation_date: Issue creation date, the start of the first status
+            minutes_in_previous_statuses: Working minutes spent in the previous status for each
+                event, if already computed; calculated from the event dates otherwise
             
         Returns:
-            List of field change records grouped by change date
+            List of status transition records with detailed information
         """
-        field_changes = []
-        
-        if not (hasattr(issue, 'changelog') and hasattr(issue.changelog, 'histories')):
-            return field_changes
+        transitions = []
         
-        for history in issue.changelog.histories:
-            # Collect all non-status changes for this history entry
-            non_status_changes = []
+        # Track timing for each transition
+        previous_status_start = creation_date
+        
+        # Bound once so the per-transition calls skip the attribute lookups
+        analyze_direction = self._analyze_transition_direction
+        append_transition = transitions.append
+        
+        for index, (history_date, from_status, to_status, author) in enumerate(status_events):
+            # Calculate time spent in previous status
+            minutes_in_previous = 0
+            if previous_status_start:
+                if minutes_in_previous_statuses is not None:
+                    minutes_in_previous = minutes_in_previous_statuses[index]
+                else:
+                    minutes_in_previous = calculate_working_minutes_between(
+                        previous_status_start, history_date
+                    )
             
-            for item in history.items:
-                if item.field != 'status':  # Exclude status changes
-                    change_record = {
-                        'field': item.field,
-                        'fieldtype': getattr(item, 'fieldtype', 'jira'),
-                        'from': item.fromString,
-                        'to': item.toString
-                    }
-                    non_status_changes.append(change_record)
+            # Determine if this is a forward or backward transition
+            is_forward, is_backflow = analyze_direction(from_status, to_status)
             
-            # Only add if there are non-status changes
-            if non_status_changes:
-                # Get author information
-                author_name = None
-                author_display = None
-                if hasattr(history, 'author'):
-                    author_name = history.author.name if hasattr(history.author, 'name') else None
-                    author_display = history.author.displayName if hasattr(history.author, 'displayName') else None
-                
-                field_change_record = {
-                    'change_date': to_iso8601(parse_date(history.created)),
-                    'author': author_display or author_name,
-                    'changes': non_status_changes
-                }
-                
-                field_changes.append(field_change_record)
+            # Calculate days and time period string for minutes_in_previous_status
+            # Using 8-hour working days (60 * 8 = 480 minutes per day)
+            days_in_previous = int(minutes_in_previous / 480) if minutes_in_previous else 0
+            period_text = format_working_minutes_to_text(minutes_in_previous)
+            
+            append_transition({
+                'from_status': from_status,
+                'to_status': to_status,
+                'transition_date': to_iso8601(history_date),
+                'minutes_in_previous_status': minutes_in_previous,
+                'days_in_previous_status': days_in_previous,
+                'period_in_previous_status': period_text,
+                'is_forward_transition': is_forward,
+                'is_backflow': is_backflow,
+                'author': author
+            })
+            
+            # Update for next iteration
+            previous_status_start = history_date
         
-        # Sort by change date
-        field_changes.sort(key=lambda x: x['change_date'])
-        return field_changes
+        return transitions
     
     def _analyze_transition_direction(self, from_status: str, to_status: str) -> Tuple[bool, bool]:
         """
@@ -736,13 +899,9 @@ class IssueHistoryExtractor:
         Returns:
             Tuple of (is_forward_transition, is_backflow)
         """
-        def get_order(status):
-            if not status:
-                return 0
-            return WORKFLOW_ORDER.get(status.lower().strip(), 999)  # Unknown statuses get high number
-        
-        from_order = get_order(from_status)
-        to_order = get_order(to_status)
+        # Reuse the memoized workflow order; unknown statuses get a high number
+        from_order = _status_info(from_status)[1] or (UNKNOWN_STATUS_ORDER if from_status else 0)
+        to_order = _status_info(to_status)[1] or (UNKNOWN_STATUS_ORDER if to_status else 0)
         
         # Forward transition: moving to higher order number
         is_forward = to_order > from_order
@@ -750,20 +909,3 @@ class IssueHistoryExtractor:
         is_backflow = from_order > to_order and (from_order - to_order) > 1
         
         return is_forward, is_backflow
-    
-    def _is_in_category(self, status: str, status_list: List[str]) -> bool:
-        """
-        Check if a status is in a given category list (case-insensitive).
-        
-        Args:
-            status: Status name to check
-            status_list: List of status names in the category
-            
-        Returns:
-            bool: True if status is in the category
-        """
-        if not status or not status_list:
-            return False
-        
-        status_lower = status.lower().strip()
-        return any(status_lower == cat_status.lower().strip() for cat_status in status_list)
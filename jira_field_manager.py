@@ -17,7 +17,27 @@ class JiraFieldManager:
     
     def __init__(self):
         """Initialize the Jira field manager."""
-        self.field_ids = {}
+        self._field_ids = {}
+        self._field_ids_version = 0
+    
+    @property
+    def field_ids(self) -> Dict[str, str]:
+        """Mapping of logical field names to Jira custom field IDs."""
+        return self._field_ids
+    
+    @field_ids.setter
+    def field_ids(self, value: Dict[str, str]) -> None:
+        self._field_ids = value
+        self._field_ids_version += 1
+    
+    @property
+    def field_ids_version(self) -> int:
+        """Counter bumped whenever field_ids is replaced or re-cached.
+        
+        Consumers that derive data from field_ids (e.g. a set of cached keys)
+        can compare this value to know when to rebuild.
+        """
+        return self._field_ids_version
     
     @staticmethod
     def safe_get_field(obj, field_name, default=None):
@@ -85,6 +105,9 @@ class JiraFieldManager:
             from config import JIRA_CUSTOM_FIELDS
             self.field_ids["epic_link"] = JIRA_CUSTOM_FIELDS.get("EPIC_LINK")
             logger.debug(f"Using fallback ID for 'Epic Link' field: {self.field_ids['epic_link']}")
+        
+        # field_ids was updated in place, let dependants know
+        self._field_ids_version += 1
     
     def get_field_id_by_name(self, field_name: str, jira_client) -> Optional[str]:
         """Find the custom field ID by its visible name.
@@ -8,7 +8,10 @@ All data is returned in ISO8601 format with timezone information.
 """
 
 import logging
-from typing import Dict, List, Any
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Dict, List, Any, Iterator, Optional
 from jira import JIRA
 import config
 from datetime import timedelta
@@ -151,10 +154,7 @@ class JiraService:
                     break
                     
                 # Process and add the current page results
-                for issue in issues_page:
-                    # Extract standardized issue data 
-                    issue_data = self._extract_issue_data(issue)
-                    all_issues.append(issue_data)
+                all_issues.extend(self.data_extractor.extract_issues_batch(issues_page))
                 
                 # If we got fewer results than requested, there are no more results
                 if len(issues_page) < page_size:
@@ -193,8 +193,12 @@ class JiraService:
             
         jira = self.connect()
         try:
-            # Expand both changelog and comments
-            issue = jira.issue(issue_key, expand='changelog,comment,parent')
+            # Expand both changelog and comments, fetching only the fields the record is built from
+            issue = jira.issue(
+                issue_key,
+                fields=','.join(self.history_extractor.requested_fields()),
+                expand='changelog,comment,parent'
+            )
             
             # Delegate to the history extractor
 
@@ -209,16 +213,25 @@ class JiraService:
             logger.error(f"Error retrieving changelog for issue {issue_key}: {str(e)}")
             raise    
     
-    def get_issue_history(self, start_date=None, end_date=None, max_issues=None) -> List[Dict[str, Any]]:
-        """Retrieve comprehensive issue records for issues updated within a date range.
+    def iter_issue_history(self, start_date=None, end_date=None, max_issues=None,
+                           max_workers: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Yield comprehensive issue records for issues updated within a date range.
+        
+        Records are produced one issue at a time, in the order JIRA returns the issues
+        (by update date), so a caller can write them out without holding them all in memory.
+        With more than one worker, changelogs are fetched by a pool of threads that overlap
+        the JIRA round trips. At most 2 * max_workers fetches run or wait ahead of the
+        consumer, so a slow consumer holds back the fetching instead of buffering records.
         
         Args:
             start_date: The start date for the search (datetime or str)
             end_date: The end date for the search (datetime or str)
             max_issues: Maximum number of issues to process
+            max_workers: Maximum number of concurrent changelog requests; defaults to
+                config.JIRA_MAX_WORKERS, and 1 fetches sequentially
             
-        Returns:
-            List of comprehensive issue records with current state, metrics, and history
+        Yields:
+            Comprehensive issue records with current state, metrics, and history
         """
         # Format dates for JQL consistently using time_utils function
         if start_date:
@@ -239,27 +252,55 @@ class JiraService:
         # Build JQL query for issues updated in the date range
         jql = f'updated >= "{start_str}" AND updated <= "{end_str}" ORDER BY updated ASC'
         
-        try:
-            # Use search_issues method to get issues instead of direct connection
-            issues = self.search_issues(jql, max_issues=max_issues)
-            logger.info(f"Found {len(issues)} issues updated in the specified date range")
+        # Use search_issues method to get issues instead of direct connection
+        issues = self.search_issues(jql, max_issues=max_issues)
+        logger.info(f"Found {len(issues)} issues updated in the specified date range")
+        
+        issue_keys = [issue_data['key'] for issue_data in issues]
+        
+        # Get detailed changelogs; the structure is a single comprehensive record per issue
+        if max_workers is None:
+            max_workers = config.JIRA_MAX_WORKERS
+        if max_workers <= 1:
+            for issue_key in issue_keys:
+                yield self.get_issue_changelog(issue_key)
+            return
+        
+        # Keep a bounded window of fetches in input order: yield the oldest, submit the next
+        remaining_keys = iter(issue_keys)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = deque(executor.submit(self.get_issue_changelog, issue_key)
+                            for issue_key in islice(remaining_keys, 2 * max_workers))
+            try:
+                while pending:
+                    record = pending.popleft().result()
+                    next_key = next(remaining_keys, None)
+                    if next_key is not None:
+                        pending.append(executor.submit(self.get_issue_changelog, next_key))
+                    yield record
+            finally:
+                # Drop fetches that have not started when the consumer stops early or a fetch fails
+                for future in pending:
+                    future.cancel()
+    
+    def get_issue_history(self, start_date=None, end_date=None, max_issues=None,
+                          max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Retrieve comprehensive issue records for issues updated within a date range.
+        
+        Args:
+            start_date: The start date for the search (datetime or str)
+            end_date: The end date for the search (datetime or str)
+            max_issues: Maximum number of issues to process
+            max_workers: Maximum number of concurrent changelog requests; defaults to
+                config.JIRA_MAX_WORKERS
             
-            # Process each issue to extract history records
-            all_history_records = []
+        Returns:
+            List of comprehensive issue records with current state, metrics, and history
+        """
+        try:
+            all_history_records = list(self.iter_issue_history(start_date, end_date, max_issues, max_workers))
             
-            for issue_data in issues:
-                issue_key = issue_data['key']
-                logger.debug(f"Processing changelog for issue {issue_key}")
-                  # Get detailed changelog using the enhanced get_issue_changelog method
-                issue_history = self.get_issue_changelog(issue_key)
-                
-                # The new structure returns a single comprehensive record per issue
-                # instead of multiple history records
-                all_history_records.append(issue_history)
-                
-                # Log that we processed this issue
-                logger.debug(f"Processed comprehensive history record for issue {issue_key}")
-              # Sort by issue created date (from issue_data section)
+            # Sort by issue updated date (from issue_data section)
             all_history_records.sort(key=lambda x: x['issue_data']['updated'])
             logger.info(f"Extracted {len(all_history_records)} comprehensive issue records")
             return all_history_records
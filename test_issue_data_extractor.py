@@ -0,0 +1,174 @@
+"""
+Test module for IssueDataExtractor.
+
+This module contains tests to verify the functionality of the IssueDataExtractor class.
+"""
+
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import patch
+import pytz
+from issue_data_extractor import IssueDataExtractor
+from jira_field_manager import JiraFieldManager
+
+
+def make_issue(**field_values):
+    """Create a minimal JIRA-like issue object with the given fields."""
+    fields = {
+        'summary': 'Test Issue',
+        'issuetype': SimpleNamespace(name='Story'),
+        'status': SimpleNamespace(name='Open'),
+        'created': '2024-01-01T09:00:00.000+0000',
+        'updated': '2024-01-02T09:00:00.000+0000',
+    }
+    fields.update(field_values)
+    return SimpleNamespace(key='TEST-1', id='1', fields=SimpleNamespace(**fields))
+
+
+class TestIssueDataExtractor(unittest.TestCase):
+    """Test cases for IssueDataExtractor class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.field_manager = JiraFieldManager()
+        self.extractor = IssueDataExtractor(self.field_manager)
+
+    def test_cached_field_set_follows_field_ids(self):
+        """Test that the cached field set is rebuilt when field_ids changes."""
+        self.assertEqual(self.extractor._cached_field_set, frozenset())
+
+        self.field_manager.field_ids = {'epic_link': 'customfield_1'}
+        self.assertEqual(self.extractor._cached_field_set, frozenset({'epic_link'}))
+
+    def test_custom_field_plan_limited_to_cached_fields(self):
+        """Test that only cached custom fields are extracted for stories."""
+        self.field_manager.field_ids = {'epic_link': 'customfield_1', 'rodzaj_pracy': 'customfield_2'}
+        issue = make_issue(customfield_1='TEST-100')
+
+        result = self.extractor.extract_issue_data(issue)
+
+        self.assertEqual(self.extractor._get_custom_field_plan()['story'], ('epic_link',))
+        self.assertEqual(result['epic_link'], 'TEST-100')
+        self.assertNotIn('story_points', result)
+
+    def test_components_and_component_names(self):
+        """Test that components and legacy component names are extracted together."""
+        issue = make_issue(components=[
+            SimpleNamespace(id='1', name='Frontend', description='UI'),
+            SimpleNamespace(id='2', name='', description='Unnamed'),
+        ])
+
+        result = self.extractor.extract_issue_data(issue)
+
+        self.assertEqual([c['id'] for c in result['components']], ['1', '2'])
+        self.assertEqual(result['component_names'], ['Frontend'])
+
+    def test_dictionary_issue(self):
+        """Test extraction from an issue given as a plain dictionary."""
+        issue = {
+            'key': 'TEST-2',
+            'id': '2',
+            'fields': {
+                'summary': 'Dict issue',
+                'issuetype': {'name': 'Bug'},
+                'assignee': {'displayName': 'Jane Smith', 'name': 'jsmith'},
+                'project': {'key': 'TEST', 'name': 'Test Project', 'id': '10'},
+            },
+        }
+
+        result = self.extractor.extract_issue_data(issue)
+
+        self.assertEqual(result['key'], 'TEST-2')
+        self.assertEqual(result['summary'], 'Dict issue')
+        self.assertEqual(result['issue_type'], 'Bug')
+        self.assertEqual(result['assignee']['display_name'], 'Jane Smith')
+        self.assertIsNone(result['assignee']['email_address'])
+        self.assertIsNone(result['reporter'])
+        self.assertEqual(result['project'], {'key': 'TEST', 'name': 'Test Project', 'id': '10'})
+        self.assertEqual(result['labels'], [])
+
+    def test_emit_legacy_disabled(self):
+        """Test that only the minimal legacy field is added when emit_legacy is False."""
+        extractor = IssueDataExtractor(self.field_manager, emit_legacy=False)
+        issue = make_issue(
+            assignee=SimpleNamespace(displayName='John Doe', key='jdoe', name='jdoe', emailAddress=None),
+            components=[SimpleNamespace(id='1', name='Frontend', description=None)],
+        )
+
+        result = extractor.extract_issue_data(issue)
+
+        self.assertEqual(result['type'], 'Story')
+        self.assertEqual(result['components'][0]['name'], 'Frontend')
+        for legacy_key in ('assignee_display_name', 'component_names',
+                           'minutes_since_creation', 'status_change_date'):
+            self.assertNotIn(legacy_key, result)
+
+    def test_extract_issues_batch_shares_reference_time(self):
+        """Test that a batch is measured against a single reference time."""
+        issues = [make_issue(created='2024-01-03T09:00:00.000+0000'),
+                  make_issue(created='2024-01-04T09:00:00.000+0000')]
+        reference_time = datetime(2024, 1, 4, 10, 0, tzinfo=pytz.UTC)
+
+        with patch('issue_data_extractor.now', return_value=reference_time) as mock_now:
+            results = self.extractor.extract_issues_batch(issues)
+
+        mock_now.assert_called_once()
+        self.assertEqual(len(results), 2)
+        self.assertEqual(results[1]['working_minutes_since_created'], 60)
+        self.assertGreater(results[0]['working_minutes_since_created'],
+                           results[1]['working_minutes_since_created'])
+
+    def test_extract_issues_parallel_preserves_order(self):
+        """Test that parallel extraction returns results in input order."""
+        issues = [SimpleNamespace(key=f'TEST-{i}', id=str(i), fields=make_issue().fields)
+                  for i in range(20)]
+
+        results = self.extractor.extract_issues_parallel(issues, max_workers=4)
+
+        self.assertEqual([r['key'] for r in results], [f'TEST-{i}' for i in range(20)])
+
+    def test_allocation_code_from_brackets(self):
+        """Test that the allocation code is read from the first complete pair of brackets."""
+        self.assertEqual(self.extractor._extract_allocation_info('Development [NEW]'),
+                         ('Development [NEW]', 'NEW'))
+        self.assertEqual(self.extractor._extract_allocation_info('x [[NEW] y'), ('x [[NEW] y', 'NEW'))
+        self.assertEqual(self.extractor._extract_allocation_info('No code'), ('No code', None))
+
+    def test_fields_accessor_for_incomplete_fields(self):
+        """Test that fields objects missing standard fields use the per-attribute getter."""
+        complete = SimpleNamespace(**{name: None for name in
+                                      ('summary', 'description', 'issuetype', 'status', 'priority',
+                                       'resolution', 'created', 'updated', 'resolutiondate',
+                                       'assignee', 'reporter', 'project', 'components', 'labels',
+                                       'parent', 'timetracking')})
+        complete.summary = 'Complete'
+        partial = SimpleNamespace(summary='Partial')
+
+        get_complete = IssueDataExtractor._fields_accessor_for(complete)
+        get_partial = IssueDataExtractor._fields_accessor_for(partial)
+
+        self.assertEqual(get_complete('summary'), 'Complete')
+        self.assertEqual(get_complete('customfield_1', 'default'), 'default')
+        self.assertEqual(get_partial('summary'), 'Partial')
+        self.assertEqual(get_partial('labels', 'default'), 'default')
+
+    def test_fields_accessor_for_issue_without_parent(self):
+        """Test that a fields object without 'parent', as JIRA sends for non-subtasks, keeps the fast path."""
+        fields = make_issue(timetracking=SimpleNamespace(originalEstimateSeconds=3600)).fields
+        for name in ('description', 'priority', 'resolution', 'resolutiondate',
+                     'assignee', 'reporter', 'project', 'components', 'labels'):
+            setattr(fields, name, None)
+        self.assertFalse(hasattr(fields, 'parent'))
+
+        with patch.object(IssueDataExtractor, '_accessor_for') as fallback:
+            get_field = IssueDataExtractor._fields_accessor_for(fields)
+
+        fallback.assert_not_called()
+        self.assertEqual(get_field('summary'), 'Test Issue')
+        self.assertIsNone(get_field('parent'))
+        self.assertEqual(get_field('timetracking').originalEstimateSeconds, 3600)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
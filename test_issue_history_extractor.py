@@ -5,10 +5,12 @@ This module contains tests to verify the functionality of the IssueHistoryExtrac
 """
 
 import unittest
+from types import SimpleNamespace
 from unittest.mock import Mock, MagicMock
 from issue_history_extractor import IssueHistoryExtractor
 from issue_data_extractor import IssueDataExtractor
 from jira_field_manager import JiraFieldManager
+from time_utils import parse_date, calculate_working_minutes_between
 import logging
 
 # Configure logging for tests
@@ -101,6 +103,97 @@ class TestIssueHistoryExtractor(unittest.TestCase):
         result = self.extractor._extract_comments(issue, "TEST-123")
         self.assertIsNone(result)
 
+    def test_extract_changelog_changes_splits_status_and_field_changes(self):
+        """Test that one changelog pass yields sorted status and field changes with authors."""
+        author = SimpleNamespace(name='jdoe', displayName='John Doe')
+        histories = [
+            SimpleNamespace(created='2024-01-03T10:00:00.000+0000', author=author, items=[
+                SimpleNamespace(field='status', fromString='In Progress', toString='Done'),
+                SimpleNamespace(field='assignee', fromString=None, toString='jdoe'),
+            ]),
+            SimpleNamespace(created='2024-01-02T10:00:00.000+0000', author=SimpleNamespace(name='asmith'), items=[
+                SimpleNamespace(field='status', fromString='Open', toString='In Progress'),
+            ]),
+        ]
+
+        status_events, field_changes = self.extractor._extract_changelog_changes(histories)
+
+        self.assertEqual([event[1:] for event in status_events],
+                         [('Open', 'In Progress', 'asmith'), ('In Progress', 'Done', 'John Doe')])
+        self.assertLess(status_events[0][0], status_events[1][0])
+        self.assertEqual(len(field_changes), 1)
+        self.assertEqual(field_changes[0]['author'], 'John Doe')
+        self.assertEqual(field_changes[0]['changes'],
+                         [{'field': 'assignee', 'fieldtype': 'jira', 'from': None, 'to': 'jdoe'}])
+
+    def test_status_change_date_is_most_recent_change_to_current_status(self):
+        """Test that a revisited status dates from its latest entry, not the first one."""
+        issue_data = {
+            'status': 'In Progress',
+            'created': parse_date('2024-01-01T09:00:00+00:00'),
+            'updated': parse_date('2024-01-05T12:00:00+00:00'),
+        }
+        status_events = [
+            (parse_date('2024-01-02T10:00:00+00:00'), 'Open', 'In Progress', None),
+            (parse_date('2024-01-03T10:00:00+00:00'), 'In Progress', 'In Review', None),
+            (parse_date('2024-01-04T10:00:00+00:00'), 'In Review', 'In Progress', None),
+        ]
+
+        metrics = self.extractor._calculate_status_metrics(issue_data, status_events)
+
+        self.assertEqual(metrics['status_change_date'], '2024-01-04T10:00:00+00:00')
+        self.assertEqual(metrics['working_minutes_in_current_status'],
+                         calculate_working_minutes_between(status_events[2][0], issue_data['updated']))
+
+    def test_single_status_change_metrics(self):
+        """Test the minutes since the only status change, shared by several metrics."""
+        issue_data = {
+            'status': 'In Progress',
+            'created': parse_date('2024-01-01T09:00:00+00:00'),
+            'updated': parse_date('2024-01-03T12:00:00+00:00'),
+        }
+        change_date = parse_date('2024-01-02T10:00:00+00:00')
+        expected = calculate_working_minutes_between(change_date, issue_data['updated'])
+
+        metrics = self.extractor._calculate_status_metrics(
+            issue_data, [(change_date, 'Backlog', 'In Progress', None)])
+
+        self.assertEqual(metrics['working_minutes_in_current_status'], expected)
+        self.assertEqual(metrics['working_minutes_from_first_move'], expected)
+        self.assertEqual(metrics['processing_minutes'], expected)
+        self.assertEqual(metrics['backlog_minutes'],
+                         calculate_working_minutes_between(issue_data['created'], change_date))
+
+    def test_unique_statuses_visited_in_visiting_order(self):
+        """Test that visited statuses are listed once each, in the order they were first visited."""
+        status_events = [
+            (parse_date('2024-01-02T10:00:00+00:00'), 'Open', 'In Progress', None),
+            (parse_date('2024-01-03T10:00:00+00:00'), 'In Progress', 'In Review', None),
+            (parse_date('2024-01-04T10:00:00+00:00'), 'In Review', 'In Progress', None),
+            (parse_date('2024-01-05T10:00:00+00:00'), 'In Progress', 'Done', None),
+        ]
+
+        metrics = self.extractor._compute_all_status_metrics(
+            status_events, parse_date('2024-01-01T09:00:00+00:00'), parse_date('2024-01-05T12:00:00+00:00'))
+
+        self.assertEqual(metrics['unique_statuses_visited'], ['Open', 'In Progress', 'In Review', 'Done'])
+
+    def test_metrics_without_status_changes(self):
+        """Test that an issue that never changed status spends all its time waiting."""
+        issue_data = {
+            'status': 'Backlog',
+            'created': parse_date('2024-01-01T09:00:00+00:00'),
+            'updated': parse_date('2024-01-03T12:00:00+00:00'),
+        }
+        expected = calculate_working_minutes_between(issue_data['created'], issue_data['updated'])
+
+        metrics = self.extractor._calculate_status_metrics(issue_data, [])
+
+        self.assertEqual(metrics['working_minutes_from_create'], expected)
+        self.assertEqual(metrics['waiting_minutes'], expected)
+        self.assertEqual(metrics['working_minutes_in_current_status'], expected)
+        self.assertIsNone(metrics['todo_exit_date'])
+
     def test_field_manager_integration(self):
         """Test that extractor properly uses field manager through data extractor."""
         # Set up mock issue data extraction
@@ -136,6 +229,28 @@ class TestIssueHistoryExtractor(unittest.TestCase):
         self.assertIn('status_transitions', result)
         self.assertIn('field_changes', result)
 
+    def test_requested_fields_include_cached_custom_fields(self):
+        """Test that the requested fields list the standard fields and cached custom field IDs."""
+        self.field_manager.field_ids = {'rodzaj_pracy': 'customfield_10001', 'epic_link': None}
+
+        fields = self.extractor.requested_fields()
+
+        self.assertIn('status', fields)
+        self.assertIn('comment', fields)
+        self.assertIn('customfield_10001', fields)
+        self.assertNotIn(None, fields)
+
+    def test_extract_issue_changelogs_parallel_preserves_order(self):
+        """Test that parallel changelog extraction returns records in input order."""
+        self.data_extractor.extract_issue_data.side_effect = lambda issue: {'key': issue.key, 'status': 'Open'}
+        issues = [SimpleNamespace(key=f'TEST-{i}', changelog=SimpleNamespace(histories=[]),
+                                  fields=SimpleNamespace(description=None, comment=None))
+                  for i in range(20)]
+
+        results = self.extractor.extract_issue_changelogs_parallel(issues, max_workers=4)
+
+        self.assertEqual([r['issue_data']['key'] for r in results], [f'TEST-{i}' for i in range(20)])
+
 
 def run_basic_test():
     """Run a basic functionality test."""
@@ -0,0 +1,118 @@
+"""
+Test module for streaming issue history records into Elasticsearch.
+
+This module verifies that JiraService.iter_issue_history fetches changelogs through a
+bounded window, and that populate_from_jira consumes it in bulk_size batches instead
+of collecting every record first.
+"""
+
+import threading
+import unittest
+from datetime import datetime
+from unittest.mock import Mock
+from es_populate import JiraElasticsearchPopulator
+from jiraservice import JiraService
+
+
+def _record(day):
+    """Build a minimal comprehensive record updated on the given day of January 2024."""
+    return {'issue_data': {'key': f'TEST-{day}', 'id': str(day),
+                           'updated': f'2024-01-{day:02d}T10:00:00+00:00'}}
+
+
+class TestIterIssueHistory(unittest.TestCase):
+    """Test cases for JiraService.iter_issue_history."""
+
+    def setUp(self):
+        """Set up a service whose search and changelog calls are mocked out."""
+        self.service = JiraService(jira_client=Mock())
+        self.service.search_issues = Mock(return_value=[{'key': f'TEST-{i}'} for i in range(20)])
+        self.lock = threading.Lock()
+        self.fetched = []
+
+    def _fetch(self, issue_key):
+        """Record the fetch and return a minimal record for the issue."""
+        with self.lock:
+            self.fetched.append(issue_key)
+        return {'issue_data': {'key': issue_key}}
+
+    def test_sequential_by_default(self):
+        """Test that changelogs are fetched one at a time unless concurrency is configured."""
+        self.service.get_issue_changelog = Mock(side_effect=self._fetch)
+
+        records = self.service.iter_issue_history('2024-01-01', '2024-01-31')
+        first = next(records)
+
+        self.assertEqual(first['issue_data']['key'], 'TEST-0')
+        self.assertEqual(self.fetched, ['TEST-0'])
+
+    def test_parallel_fetch_preserves_order(self):
+        """Test that concurrent fetches still yield records in search order."""
+        self.service.get_issue_changelog = Mock(side_effect=self._fetch)
+
+        records = list(self.service.iter_issue_history('2024-01-01', '2024-01-31', max_workers=4))
+
+        self.assertEqual([r['issue_data']['key'] for r in records], [f'TEST-{i}' for i in range(20)])
+
+    def test_parallel_fetch_window_is_bounded(self):
+        """Test that fetching stays at most 2 * max_workers issues ahead of the consumer."""
+        self.service.get_issue_changelog = Mock(side_effect=self._fetch)
+
+        records = self.service.iter_issue_history('2024-01-01', '2024-01-31', max_workers=2)
+        next(records)
+        records.close()
+
+        # The first window of four, plus the one submitted when the first record was taken
+        self.assertLessEqual(len(self.fetched), 5)
+
+
+class TestPopulateFromJiraStreaming(unittest.TestCase):
+    """Test cases for the streaming path of JiraElasticsearchPopulator.populate_from_jira."""
+
+    def setUp(self):
+        """Set up a populator with JIRA and Elasticsearch calls mocked out."""
+        self.populator = JiraElasticsearchPopulator(agent_name="TestAgent")
+        self.populator.connected = True
+        self.populator.jira_service = Mock()
+        self.populator.update_sync_date = Mock()
+        self.batches = []
+
+    def _stream(self, records):
+        """Yield records while counting how many were pulled from the stream."""
+        self.pulled = 0
+        for record in records:
+            self.pulled += 1
+            yield record
+
+    def test_records_are_inserted_in_bulk_size_batches(self):
+        """Test that records are inserted batch by batch and the last batch date is saved."""
+        self.populator.jira_service.iter_issue_history.return_value = self._stream(
+            [_record(day) for day in range(1, 6)])
+        self.populator.bulk_insert_issue_history = Mock(
+            side_effect=lambda batch, force_override=False: self.batches.append(batch) or len(batch))
+
+        count = self.populator.populate_from_jira('2024-01-01', '2024-01-31', bulk_size=2)
+
+        self.assertEqual(count, 5)
+        self.assertEqual([len(batch) for batch in self.batches], [2, 2, 1])
+        self.populator.update_sync_date.assert_called_once_with(
+            datetime.fromisoformat('2024-01-05T10:00:00+00:00'))
+
+    def test_failed_batch_stops_reading_the_stream(self):
+        """Test that a failed bulk insert stops the sync at the last successful batch."""
+        self.populator.jira_service.iter_issue_history.return_value = self._stream(
+            [_record(day) for day in range(1, 7)])
+        results = iter([2, 0])
+        self.populator.bulk_insert_issue_history = Mock(
+            side_effect=lambda batch, force_override=False: next(results))
+
+        count = self.populator.populate_from_jira('2024-01-01', '2024-01-31', bulk_size=2)
+
+        self.assertEqual(count, 2)
+        self.assertEqual(self.pulled, 4)
+        self.populator.update_sync_date.assert_called_once_with(
+            datetime.fromisoformat('2024-01-02T10:00:00+00:00'))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -103,6 +103,37 @@ def test_since_date():
     minutes = calculate_working_minutes_since_date(yesterday)
     print(f"Minutes since yesterday 10 AM: {minutes}")
 
+def test_parse_date_formats():
+    """Test that JIRA and non-ISO date strings parse to the same timezone-aware values."""
+    print("\n=== Testing Date Parsing ===")
+    
+    jira_date = parse_date("2025-05-27T10:00:00.000+0200")
+    print(f"JIRA timestamp: {jira_date.isoformat()}")
+    assert jira_date.isoformat() == "2025-05-27T10:00:00+02:00"
+    
+    # Naive dates get the default timezone
+    assert parse_date("2025-05-27 10:00:00").isoformat() == "2025-05-27T10:00:00+00:00"
+    
+    # Formats datetime.fromisoformat rejects still go through dateutil
+    fallback_date = parse_date("May 27 2025 10:00")
+    print(f"Fallback format: {fallback_date.isoformat()}")
+    assert fallback_date.isoformat() == "2025-05-27T10:00:00+00:00"
+    
+    assert parse_date("not a date") is None
+
+def test_long_ranges():
+    """Test multi-week ranges, whose inner days are counted without walking them."""
+    print("\n=== Testing Long Ranges ===")
+    
+    minutes = calculate_working_minutes_between("2024-01-01 09:00:00", "2024-12-31 17:00:00")
+    print(f"Full year 2024: {minutes / 480} working days (expected: 252)")
+    assert minutes == 252 * 480
+    
+    # Friday noon to Tuesday after Epiphany, across Christmas, New Year and Epiphany
+    minutes = calculate_working_minutes_between("2024-12-20 12:00:00", "2025-01-07 10:00:00")
+    print(f"Across the holiday season: {minutes} minutes (expected: 3720)")
+    assert minutes == 3720
+
 if __name__ == "__main__":
     print("Testing Working Time Calculation Functions")
     print("=" * 50)
@@ -112,6 +143,8 @@ if __name__ == "__main__":
     test_polish_holidays()
     test_edge_cases()
     test_since_date()
+    test_parse_date_formats()
+    test_long_ranges()
     
     print("\n" + "=" * 50)
     print("Test completed!")
@@ -7,6 +7,7 @@ ensuring consistent formatting throughout the application.
 
 import logging
 from datetime import datetime, timezone, timedelta, time
+from functools import lru_cache
 import dateutil.parser
 import pytz
 import holidays
@@ -21,6 +22,52 @@ DEFAULT_TIMEZONE = timezone.utc
 WORK_START_HOUR = 9
 WORK_END_HOUR = 17
 MINUTES_PER_WORK_DAY = (WORK_END_HOUR - WORK_START_HOUR) * 60  # 480 minutes
+_WORK_START_TIME = time(WORK_START_HOUR)
+_WORK_END_TIME = time(WORK_END_HOUR)
+
+@lru_cache(maxsize=4096)
+def _parse_date_string(date_string):
+    """
+    Parse a date string into a timezone-aware datetime, memoizing the result.
+    
+    JIRA timestamps (e.g. '2023-01-01T10:00:00.000+0000') are handled by the fast
+    datetime.fromisoformat; anything it rejects falls back to dateutil. The same
+    timestamps recur across changelog histories, so results are cached.
+    
+    Args:
+        date_string: Date string in any reasonable format
+        
+    Returns:
+        datetime: Datetime object with timezone information
+        
+    Raises:
+        ValueError: If the string cannot be parsed
+    """
+    try:
+        dt = datetime.fromisoformat(date_string)
+    except ValueError:
+        dt = dateutil.parser.parse(date_string)
+    
+    # Ensure timezone information is present
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=DEFAULT_TIMEZONE)
+    return dt
+
+@lru_cache(maxsize=4096)
+def _iso8601_from_string(date_string):
+    """
+    Convert a date string to ISO8601 format, memoizing the result.
+    
+    Issue dates such as 'created' and 'updated' are formatted several times per
+    issue, so the formatted string is cached along with the parse.
+    
+    Args:
+        date_string: Date string in any reasonable format
+        
+    Returns:
+        str: Date in ISO8601 format with timezone information
+    """
+    return _parse_date_string(date_string).isoformat()
 
 def to_iso8601(date_value):
     """
@@ -36,11 +83,10 @@ def to_iso8601(date_value):
         return None
         
     try:
-        # If it's already a string, try to parse it
+        # If it's already a string, parse and format it through the cache
         if isinstance(date_value, str):
-            dt = dateutil.parser.parse(date_value)
-        else:
-            dt = date_value
+            return _iso8601_from_string(date_value)
+        dt = date_value
             
         # Ensure timezone information is present
         if dt.tzinfo is None:
@@ -69,8 +115,10 @@ def parse_date(date_string):
         # If it's already a datetime object, just ensure timezone
         if isinstance(date_string, datetime):
             dt = date_string
+        elif isinstance(date_string, str):
+            return _parse_date_string(date_string)
         else:
-            # Parse string input
+            # Leave any other input type to dateutil
             dt = dateutil.parser.parse(date_string)
         
         # Ensure timezone information is present
@@ -194,6 +242,22 @@ def calculate_days_since_date(date_string):
         logger.error(f"Error calculating days since date: {e}")
         return None
 
+@lru_cache(maxsize=64)
+def _polish_holidays(year):
+    """
+    Get the set of Polish holiday dates for a year, memoizing the result.
+    
+    Building the holidays calendar is far more expensive than the membership test,
+    and the working minutes calculation checks every day it walks over.
+    
+    Args:
+        year: Calendar year
+        
+    Returns:
+        frozenset: Dates of the Polish holidays in that year
+    """
+    return frozenset(holidays.Poland(years=year).keys())
+
 def is_polish_holiday(date_obj):
     """
     Check if a given date is a Polish holiday.
@@ -205,8 +269,7 @@ def is_polish_holiday(date_obj):
         bool: True if the date is a Polish holiday, False otherwise
     """
     try:
-        polish_holidays = holidays.Poland(years=date_obj.year)
-        return date_obj.date() in polish_holidays
+        return date_obj.date() in _polish_holidays(date_obj.year)
     except Exception as e:
         logger.error(f"Error checking Polish holiday for {date_obj}: {e}")
         return False
@@ -228,6 +291,32 @@ def is_working_day(date_obj):
     # Check if it's not a Polish holiday
     return not is_polish_holiday(date_obj)
 
+def _count_working_days(first_day, last_day):
+    """
+    Count the working days (Monday-Friday, not a Polish holiday) in an inclusive date range.
+    
+    Weekdays are counted arithmetically, so the cost does not grow with the length of the range.
+    
+    Args:
+        first_day: First date of the range
+        last_day: Last date of the range
+        
+    Returns:
+        int: Number of working days, 0 for an empty range
+    """
+    day_count = (last_day - first_day).days + 1
+    if day_count <= 0:
+        return 0
+    
+    full_weeks, extra_days = divmod(day_count, 7)
+    first_weekday = first_day.weekday()
+    working_days = full_weeks * 5 + sum(1 for i in range(extra_days) if (first_weekday + i) % 7 < 5)
+    
+    for year in range(first_day.year, last_day.year + 1):
+        working_days -= sum(1 for holiday in _polish_holidays(year)
+                            if first_day <= holiday <= last_day and holiday.weekday() < 5)
+    return working_days
+
 def calculate_working_minutes_between(start_date, end_date):
     """
     Calculate the number of working minutes between two dates.
@@ -263,19 +352,27 @@ def calculate_working_minutes_between(start_date, end_date):
         
         # Special case: if start and end dates are on the same day,
         # calculate actual minutes regardless of working hours
+        # (even on non-working days, so no working day check is needed)
         if start_date.date() == end_date.date():
-            if is_working_day(start_date):
-                total_minutes = int((end_date - start_date).total_seconds() / 60)
-                return total_minutes
-            else:
-                # Even on non-working days, if it's the same day, count the minutes
-                total_minutes = int((end_date - start_date).total_seconds() / 60)
-                return total_minutes
+            return int((end_date - start_date).total_seconds() / 60)
             
         total_minutes = 0
-        current_date = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
+        start_midnight = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
+        day_span = (end_date.date() - start_date.date()).days
+        
+        # Days well inside the range are whole working days, counted in closed form.
+        # Only the first day and the last two are checked hour by hour, since the end
+        # date's UTC offset may differ from the start date's (e.g. across DST).
+        if day_span >= 3:
+            total_minutes += MINUTES_PER_WORK_DAY * _count_working_days(
+                start_date.date() + timedelta(days=1), end_date.date() - timedelta(days=2)
+            )
+            day_offsets = (0, day_span - 1, day_span)
+        else:
+            day_offsets = range(day_span + 1)
         
-        while current_date.date() <= end_date.date():
+        for day_offset in day_offsets:
+            current_date = start_midnight + timedelta(days=day_offset)
             if is_working_day(current_date):
                 # Determine work start and end times for this day
                 work_start = current_date.replace(hour=WORK_START_HOUR, minute=0, second=0, microsecond=0)
@@ -286,11 +383,11 @@ def calculate_working_minutes_between(start_date, end_date):
                 day_end = min(end_date, work_end)
                 
                 # Only count if there's overlap with working hours
-                if day_start < day_end and day_start.time() < time(WORK_END_HOUR) and day_end.time() > time(WORK_START_HOUR):
+                if day_start < day_end and day_start.time() < _WORK_END_TIME and day_end.time() > _WORK_START_TIME:
                     # Ensure times are within working hours
-                    if day_start.time() < time(WORK_START_HOUR):
+                    if day_start.time() < _WORK_START_TIME:
                         day_start = day_start.replace(hour=WORK_START_HOUR, minute=0, second=0, microsecond=0)
-                    if day_end.time() > time(WORK_END_HOUR):
+                    if day_end.time() > _WORK_END_TIME:
                         day_end = day_end.replace(hour=WORK_END_HOUR, minute=0, second=0, microsecond=0)
                     
                     # Calculate minutes for this day
@@ -298,20 +395,19 @@ def calculate_working_minutes_between(start_date, end_date):
                         day_minutes = int((day_end - day_start).total_seconds() / 60)
                         total_minutes += day_minutes
             
-            current_date += timedelta(days=1)
-            
         return total_minutes
         
     except Exception as e:
         logger.error(f"Error calculating working minutes: {e}")
         return None
 
-def calculate_working_minutes_since_date(date_string):
+def calculate_working_minutes_since_date(date_string, reference_date=None):
     """
     Calculate the number of working minutes between a given date and now.
     
     Args:
         date_string: Date string in any reasonable format
+        reference_date: Optional datetime to measure up to instead of now()
         
     Returns:
         int: Number of working minutes since the given date, or None if date_string is None
@@ -323,7 +419,7 @@ def calculate_working_minutes_since_date(date_string):
         start_date = parse_date(date_string)
         if start_date is None:
             return None
-        return calculate_working_minutes_between(start_date, now())
+        return calculate_working_minutes_between(start_date, reference_date or now())
     except Exception as e:
         logger.error(f"Error calculating working minutes since date: {e}")
         return None
@@ -4,6 +4,7 @@ Contains helper functions for date calculations, string manipulations, and other
 """
 
 import logging
+import sys
 from datetime import datetime, timedelta, timezone
 import dateutil.parser
 import pytz
@@ -378,4 +379,16 @@ def normalize_status_name(status_name: str) -> str:
     if normalized != status_name:
         logger.debug(f"Normalized status '{status_name}' to '{normalized}'")
         
-    return normalized
\ No newline at end of file
+    return normalized
+
+def intern_str(value: Optional[str]) -> Optional[str]:
+    """
+    Intern a string so repeated values (status, type, project and user names) share one object.
+    
+    Args:
+        value: String to intern; None and non-string values are returned unchanged
+        
+    Returns:
+        The interned string, or the value itself
+    """
+    return sys.intern(value) if type(value) is str else value